@@ -1,12 +1,38 @@
 """
 API module.
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from ..config import config
+from ..core.config import flush as flush_dynamic_config
 from ..middleware.error_handler import ErrorHandlerMiddleware
+from ..storage import get_storage
 from .routes import router
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Manage application-wide resources.
+    
+    The storage backend is created once at startup and shared by all
+    requests through ``app.state.storage``. Pending dynamic config
+    updates are written out on shutdown.
+    
+    Args:
+        app: FastAPI application
+    """
+    app.state.storage = get_storage()
+    try:
+        yield
+    finally:
+        await flush_dynamic_config()
+        storage = app.state.storage
+        if hasattr(storage, 'close'):
+            await storage.close()
+        del app.state.storage
+
 def create_app() -> FastAPI:
     """Create FastAPI application.
     
@@ -18,6 +44,8 @@ def create_app() -> FastAPI:
         title="Blob Service API",
         description="File storage service API",
         version="0.1.0",  # TODO: Get from package
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # Get config
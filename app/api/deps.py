@@ -1,79 +1,66 @@
 """
 API dependencies.
 """
-from typing import Optional, Annotated
-from fastapi import Depends, HTTPException, Header, Request
-from fastapi.security import HTTPBasic, HTTPBasicCredentials
+from typing import Annotated
+from fastapi import Depends, HTTPException, Request
+import base64
 import secrets
 from ..config import config
 from ..core.errors import AuthError, ValidationError
+from ..storage import BaseStorage
 
-# Basic auth scheme
-security = HTTPBasic()
+# Configuration is immutable after startup, resolve it once
+cfg = config()
+_REQUIRE_AUTH = cfg.auth.require_auth
+_ADMIN_USER_B = cfg.auth.admin_user.encode("utf8")
+_ADMIN_PW_B = cfg.auth.admin_password.encode("utf8")
+_ADMIN_BASIC_TOKEN = base64.b64encode(_ADMIN_USER_B + b":" + _ADMIN_PW_B)
+_MAX_FILE_SIZE = cfg.storage.max_file_size
+_CORS_ORIGINS = frozenset(cfg.cors_origins)
+_CORS_WILDCARD = "*" in _CORS_ORIGINS
 
-def get_auth_header(
-    authorization: Optional[str] = Header(None)
-) -> Optional[str]:
-    """Get authorization header.
-    
-    Args:
-        authorization: Authorization header
-        
-    Returns:
-        Authorization token if present
-    """
-    return authorization
-
-def verify_auth(
-    credentials: Annotated[HTTPBasicCredentials, Depends(security)]
-) -> None:
+def verify_auth(request: Request) -> None:
     """Verify basic auth credentials.
     
+    The encoded ``user:password`` token is compared in constant time
+    against the admin token precomputed at startup.
+    
     Args:
-        credentials: Basic auth credentials
+        request: FastAPI request
         
     Raises:
         AuthError: If authentication fails
     """
-    # Get config
-    cfg = config()
-    
     # Skip auth if not required
-    if not cfg.auth.require_auth:
+    if not _REQUIRE_AUTH:
         return
         
     # Verify credentials
-    correct_username = secrets.compare_digest(
-        credentials.username.encode("utf8"),
-        cfg.auth.admin_user.encode("utf8")
-    )
-    correct_password = secrets.compare_digest(
-        credentials.password.encode("utf8"),
-        cfg.auth.admin_password.encode("utf8")
-    )
-    
-    if not (correct_username and correct_password):
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        raise AuthError("Missing authorization credentials")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "basic" or not secrets.compare_digest(
+        token.strip().encode("utf8"),
+        _ADMIN_BASIC_TOKEN
+    ):
         raise AuthError("Invalid credentials")
 
-def verify_token(
-    token: Annotated[Optional[str], Depends(get_auth_header)]
-) -> None:
+def verify_token(request: Request) -> None:
     """Verify JWT token.
     
     Args:
-        token: JWT token
+        request: FastAPI request
         
     Raises:
         AuthError: If token is invalid
     """
-    # Get config
-    cfg = config()
-    
     # Skip auth if not required
-    if not cfg.auth.require_auth:
+    if not _REQUIRE_AUTH:
         return
         
     # Verify token is present
+    token = request.headers.get("authorization")
     if not token:
         raise AuthError("Missing authorization token")
         
@@ -91,48 +78,68 @@ def verify_content_length(request: Request) -> None:
     Raises:
         ValidationError: If content length exceeds limit
     """
-    # Get config
-    cfg = config()
-    
-    # Skip check if no limit set
-    if cfg.storage.max_file_size <= 0:
-        return
-        
     # Get content length
     content_length = request.headers.get("content-length")
     if not content_length:
         return
         
     # Verify size
-    try:
-        size = int(content_length)
-        if size > cfg.storage.max_file_size:
-            raise ValidationError(
-                f"File size {size} exceeds limit {cfg.storage.max_file_size}"
-            )
-    except ValueError:
+    if not content_length.isdecimal():
         raise ValidationError("Invalid content length header")
+    size = int(content_length)
+    if size > _MAX_FILE_SIZE:
+        raise ValidationError(
+            f"File size {size} exceeds limit {_MAX_FILE_SIZE}"
+        )
 
-def verify_cors_origin(
-    origin: Optional[str] = Header(None)
-) -> None:
+# Skip check entirely if no limit set
+if _MAX_FILE_SIZE <= 0:
+    def verify_content_length(request: Request) -> None:
+        """Verify request content length (no limit configured)."""
+
+def verify_request(request: Request) -> None:
+    """Verify request content length and basic auth credentials.
+    
+    Combines ``verify_content_length`` and ``verify_auth`` into a single
+    dependency for upload endpoints.
+    
+    Args:
+        request: FastAPI request
+        
+    Raises:
+        ValidationError: If content length exceeds limit
+        AuthError: If authentication fails
+    """
+    verify_content_length(request)
+    verify_auth(request)
+
+def get_storage_backend(request: Request) -> BaseStorage:
+    """Get the storage backend created at application startup.
+    
+    Args:
+        request: FastAPI request
+        
+    Returns:
+        Storage backend instance
+    """
+    return request.app.state.storage
+
+def verify_cors_origin(request: Request) -> None:
     """Verify CORS origin.
     
     Args:
-        origin: Origin header
+        request: FastAPI request
         
     Raises:
         ValidationError: If origin is not allowed
     """
-    # Get config
-    cfg = config()
-    
     # Skip check if all origins allowed
-    if "*" in cfg.cors_origins:
+    if _CORS_WILDCARD:
         return
         
     # Verify origin is allowed
-    if origin and origin not in cfg.cors_origins:
+    origin = request.headers.get("origin")
+    if origin and origin not in _CORS_ORIGINS:
         raise ValidationError(f"Origin {origin} not allowed")
 
 # Common dependencies
@@ -140,3 +147,14 @@ CommonDeps = Annotated[None, Depends(verify_auth)]
 TokenDeps = Annotated[None, Depends(verify_token)]
 ContentDeps = Annotated[None, Depends(verify_content_length)]
 CorsDeps = Annotated[None, Depends(verify_cors_origin)]
+RequestDeps = Annotated[None, Depends(verify_request)]
+StorageDeps = Annotated[BaseStorage, Depends(get_storage_backend)]
+
+def skip_auth() -> None:
+    """No-op dependency used when authentication is disabled."""
+
+# Leave nothing for the dependency solver to parse when auth is disabled
+if not _REQUIRE_AUTH:
+    CommonDeps = Annotated[None, Depends(skip_auth)]
+    TokenDeps = Annotated[None, Depends(skip_auth)]
+    RequestDeps = ContentDeps
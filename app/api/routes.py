@@ -2,41 +2,61 @@
 API routes.
 """
 from typing import List, Optional
-from fastapi import APIRouter, UploadFile, File, Query, Path, Depends
+from fastapi import APIRouter, UploadFile, File, Query, Path
 from ..config import config
 from ..core.errors import ValidationError, NotFoundError
-from ..storage import get_storage
 from .models import (
     FileUploadResponse,
     FileListResponse,
     FileDeleteResponse,
+    StorageConfig,
     StorageConfigResponse,
     HealthResponse,
     HealthInfo,
     HealthStatus,
 )
-from .deps import CommonDeps, ContentDeps
+from .deps import CommonDeps, RequestDeps, StorageDeps
 from .utils import get_uptime
 
 # Create router
 router = APIRouter()
 
+# Configuration is immutable after startup, resolve it once
+cfg = config()
+
+# Delete response carries no data, share a single instance
+_FILE_DELETE_OK = FileDeleteResponse()
+
+# Storage configuration response never changes, build it once
+_STORAGE_CONFIG_RESPONSE = StorageConfigResponse(
+    data=StorageConfig(
+        type=cfg.storage.type,
+        path=cfg.storage.local_path,
+        domain=cfg.storage.local_domain,
+        bucket=cfg.storage.s3_bucket,
+        endpoint=cfg.storage.s3_endpoint,
+        region=cfg.storage.s3_region,
+    )
+)
+
 @router.post(
     "/upload",
-    response_model=FileUploadResponse,
-    dependencies=[Depends(ContentDeps)],
+    response_model=None,
+    responses={200: {"model": FileUploadResponse}},
     description="Upload file to storage"
 )
 async def upload_file(
     file: UploadFile = File(...),
     path: Optional[str] = Query(None, description="Storage path"),
-    _: CommonDeps = None
+    storage: StorageDeps = None,
+    _: RequestDeps = None
 ) -> FileUploadResponse:
     """Upload file to storage.
     
     Args:
         file: File to upload
         path: Optional storage path
+        storage: Storage backend
         
     Returns:
         Upload response with file info
@@ -44,9 +64,6 @@ async def upload_file(
     Raises:
         ValidationError: If file upload fails
     """
-    # Get storage backend
-    storage = get_storage()
-    
     # Upload file
     file_info = await storage.upload_file(file, path)
     
@@ -55,12 +72,14 @@ async def upload_file(
 
 @router.get(
     "/files",
-    response_model=FileListResponse,
+    response_model=None,
+    responses={200: {"model": FileListResponse}},
     description="List files in storage"
 )
 async def list_files(
     path: Optional[str] = Query(None, description="Storage path"),
     recursive: bool = Query(False, description="List files recursively"),
+    storage: StorageDeps = None,
     _: CommonDeps = None
 ) -> FileListResponse:
     """List files in storage.
@@ -68,13 +87,11 @@ async def list_files(
     Args:
         path: Optional storage path
         recursive: List files recursively
+        storage: Storage backend
         
     Returns:
         List response with file info
     """
-    # Get storage backend
-    storage = get_storage()
-    
     # List files
     files = await storage.list_files(path, recursive)
     
@@ -83,17 +100,20 @@ async def list_files(
 
 @router.delete(
     "/files/{file_path:path}",
-    response_model=FileDeleteResponse,
+    response_model=None,
+    responses={200: {"model": FileDeleteResponse}},
     description="Delete file from storage"
 )
 async def delete_file(
     file_path: str = Path(..., description="File path"),
+    storage: StorageDeps = None,
     _: CommonDeps = None
 ) -> FileDeleteResponse:
     """Delete file from storage.
     
     Args:
         file_path: Path to file
+        storage: Storage backend
         
     Returns:
         Delete response
@@ -101,18 +121,16 @@ async def delete_file(
     Raises:
         NotFoundError: If file not found
     """
-    # Get storage backend
-    storage = get_storage()
-    
     # Delete file
     await storage.delete_file(file_path)
     
     # Return response
-    return FileDeleteResponse()
+    return _FILE_DELETE_OK
 
 @router.get(
     "/config/storage",
-    response_model=StorageConfigResponse,
+    response_model=None,
+    responses={200: {"model": StorageConfigResponse}},
     description="Get storage configuration"
 )
 async def get_storage_config(
@@ -123,36 +141,26 @@ async def get_storage_config(
     Returns:
         Storage configuration response
     """
-    # Get config
-    cfg = config()
-    
-    # Return response
-    return StorageConfigResponse(
-        data={
-            "type": cfg.storage.type,
-            "path": cfg.storage.local_path,
-            "domain": cfg.storage.local_domain,
-            "bucket": cfg.storage.s3_bucket,
-            "endpoint": cfg.storage.s3_endpoint,
-            "region": cfg.storage.s3_region,
-        }
-    )
+    return _STORAGE_CONFIG_RESPONSE
 
 @router.get(
     "/health",
-    response_model=HealthResponse,
+    response_model=None,
+    responses={200: {"model": HealthResponse}},
     description="Get service health status"
 )
-async def health_check() -> HealthResponse:
+async def health_check(
+    storage: StorageDeps = None
+) -> HealthResponse:
     """Get service health status.
     
+    Args:
+        storage: Storage backend
+        
     Returns:
         Health check response
     """
     try:
-        # Get storage backend
-        storage = get_storage()
-        
         # Check storage
         storage_info = await storage.get_info()
         
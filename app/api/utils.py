@@ -1,12 +1,17 @@
 """
 API utility functions.
 """
+import os
+import sys
 import time
-import mimetypes
-from typing import Optional, Dict, Any, Tuple
+import shutil
+from os.path import splitext
+from typing import Optional, Dict, Any, Tuple, BinaryIO
 from pathlib import Path
+from tempfile import SpooledTemporaryFile
 import aiofiles
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from ..config import config
 from ..core.errors import ValidationError
 from .models import FileInfo
@@ -14,6 +19,51 @@ from .models import FileInfo
 # Start time for uptime calculation
 START_TIME = time.time()
 
+# Content types of supported file extensions
+_EXT_CONTENT_TYPES: Dict[str, str] = {
+    # Images
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.bmp': 'image/bmp',
+    '.svg': 'image/svg+xml',
+    # Documents
+    '.pdf': 'application/pdf',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.ppt': 'application/vnd.ms-powerpoint',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    '.txt': 'text/plain',
+    '.md': 'text/markdown',
+    '.json': 'application/json',
+    # Spreadsheets
+    '.csv': 'text/csv',
+    '.xls': 'application/vnd.ms-excel',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    # Audio/video
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.mp4': 'video/mp4',
+}
+
+# (content type, is image) keyed by extension
+_EXT_TYPE_INFO: Dict[str, Tuple[str, bool]] = {
+    ext: (content_type, content_type.startswith('image/'))
+    for ext, content_type in _EXT_CONTENT_TYPES.items()
+}
+_UNKNOWN_TYPE_INFO: Tuple[str, bool] = ('application/octet-stream', False)
+
+# Units for human readable sizes, one per power of 1024
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Block size for disk-to-disk upload copies
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Linux supports sendfile between regular files
+_HAS_SENDFILE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
 def get_uptime() -> float:
     """Get application uptime in seconds.
     
@@ -22,6 +72,17 @@ def get_uptime() -> float:
     """
     return time.time() - START_TIME
 
+def _get_type_info(filename: str) -> Tuple[str, bool]:
+    """Get file content type and whether it is an image.
+    
+    Args:
+        filename: Filename to check
+        
+    Returns:
+        Tuple of (content type, is image)
+    """
+    return _EXT_TYPE_INFO.get(splitext(filename)[1].lower(), _UNKNOWN_TYPE_INFO)
+
 def get_content_type(filename: str) -> str:
     """Get file content type.
     
@@ -31,8 +92,7 @@ def get_content_type(filename: str) -> str:
     Returns:
         Content type string
     """
-    content_type, _ = mimetypes.guess_type(filename)
-    return content_type or 'application/octet-stream'
+    return _get_type_info(filename)[0]
 
 def is_image_file(content_type: str) -> bool:
     """Check if content type is an image.
@@ -45,6 +105,53 @@ def is_image_file(content_type: str) -> bool:
     """
     return content_type.startswith('image/')
 
+def _is_disk_backed(fileobj: BinaryIO) -> bool:
+    """Check if file object is backed by a file on disk.
+    
+    ``SpooledTemporaryFile`` keeps small uploads in memory until rolled
+    over, and calling its ``fileno`` forces the rollover. Its ``_rolled``
+    flag is checked instead; if a Python version lacks it, the file is
+    treated as in memory and copied through the regular read path.
+    
+    Args:
+        fileobj: File object to check
+        
+    Returns:
+        True if the object has an OS-level file descriptor
+    """
+    if isinstance(fileobj, SpooledTemporaryFile):
+        return getattr(fileobj, '_rolled', False)
+    try:
+        fileobj.fileno()
+    except (AttributeError, OSError):
+        return False
+    return True
+
+def _copy_to_path(src: BinaryIO, file_path: Path) -> int:
+    """Copy disk-backed file object to path.
+    
+    Uses ``os.sendfile`` so the data is copied in kernel space, falling
+    back to ``shutil.copyfileobj`` where it is not available.
+    
+    Args:
+        src: Source file object
+        file_path: Destination path
+        
+    Returns:
+        Number of bytes copied
+    """
+    with open(file_path, 'wb') as dst:
+        if not _HAS_SENDFILE:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+            return dst.tell()
+            
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        offset = src.tell()
+        size = 0
+        while sent := os.sendfile(dst_fd, src_fd, offset + size, COPY_CHUNK_SIZE):
+            size += sent
+        return size
+
 async def save_upload_file(
     file: UploadFile,
     directory: Path,
@@ -52,6 +159,9 @@ async def save_upload_file(
 ) -> Tuple[Path, int]:
     """Save uploaded file.
     
+    Uploads already spooled to disk are copied without passing through
+    Python; small in-memory uploads are written in chunks.
+    
     Args:
         file: File to save
         directory: Directory to save to
@@ -70,6 +180,11 @@ async def save_upload_file(
         # Generate file path
         file_path = directory / file.filename
         
+        # Copy spooled file on disk
+        if _is_disk_backed(file.file):
+            size = await run_in_threadpool(_copy_to_path, file.file, file_path)
+            return file_path, size
+        
         # Save file
         size = 0
         async with aiofiles.open(file_path, 'wb') as f:
@@ -100,7 +215,7 @@ def create_file_info(
         FileInfo instance
     """
     # Get content type
-    content_type = get_content_type(filename)
+    content_type, is_image = _get_type_info(filename)
     
     # Create file info
     return FileInfo(
@@ -108,7 +223,7 @@ def create_file_info(
         size=size,
         content_type=content_type,
         url=url,
-        is_image=is_image_file(content_type),
+        is_image=is_image,
         metadata=metadata or {}
     )
 
@@ -121,8 +236,7 @@ def format_size(size: int) -> str:
     Returns:
         Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} PB"
+    if size < 1024:
+        return f"{size:.1f} B"
+    unit = min((int(size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
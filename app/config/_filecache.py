@@ -0,0 +1,81 @@
+"""
+Parsed configuration file cache.
+"""
+import os
+from functools import lru_cache
+from typing import Dict, Any, Optional
+from ..utils import jsonutil
+
+def write_atomic(path: os.PathLike, data: bytes) -> None:
+    """Write a file so readers see either the old or the new contents.
+
+    The data is written and fsynced to a temporary file next to ``path``,
+    which then replaces ``path`` in a single rename.
+
+    Args:
+        path: File path
+        data: File contents
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path = os.fspath(path)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+@lru_cache(maxsize=32)
+def _parse(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Read and parse a JSON file.
+
+    The modification time and size are part of the cache key only, so a
+    changed file misses the cache and stale entries are evicted over time.
+
+    Args:
+        path: File path
+        mtime_ns: File modification time in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        Parsed file contents
+    """
+    with open(path, "rb") as f:
+        return jsonutil.loads(f.read())
+
+def get(path: os.PathLike, st: Optional[os.stat_result] = None) -> Dict[str, Any]:
+    """Get parsed contents of a JSON file.
+
+    The file is only parsed again when its modification time or size
+    changes. The returned dict is shared between callers and must not
+    be mutated.
+
+    Args:
+        path: File path
+        st: Result of a ``stat`` the caller already made on the file
+
+    Returns:
+        Parsed file contents
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    path = os.fspath(path)
+    if st is None:
+        st = os.stat(path)
+    return _parse(path, st.st_mtime_ns, st.st_size)
+
+def clear() -> None:
+    """Drop all cached entries."""
+    _parse.cache_clear()
@@ -1,10 +1,11 @@
 """
 Cache configuration settings.
 """
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Mapping, Any
 
-# Default cache settings
-DEFAULT_CACHE_CONFIG: Dict[str, Any] = {
+# Default cache settings (read-only, copy before modifying)
+DEFAULT_CACHE_CONFIG: Mapping[str, Any] = MappingProxyType({
     # Cache directory path (relative to app root)
     'cache_dir': 'cache',
     
@@ -21,16 +22,16 @@ DEFAULT_CACHE_CONFIG: Dict[str, Any] = {
     'backend': 'disk',
     
     # Redis configuration (if using redis backend)
-    'redis': {
+    'redis': MappingProxyType({
         'host': 'localhost',
         'port': 6379,
         'db': 0,
         'password': None,
         'prefix': 'blob_service_cache:'
-    },
+    }),
     
     # File types to cache (empty list means cache all)
-    'cache_types': [],
+    'cache_types': (),
     
     # Maximum file size to cache in bytes (default: 100MB)
     'max_file_size': 100 * 1024 * 1024,
@@ -49,4 +50,4 @@ DEFAULT_CACHE_CONFIG: Dict[str, Any] = {
     
     # Cache memory buffer size in bytes (default: 64MB)
     'buffer_size': 64 * 1024 * 1024
-}
+})
@@ -2,12 +2,98 @@
 Configuration manager.
 """
 import os
-import json
+from collections import ChainMap
+from dataclasses import fields, replace
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Any, Optional
-from .models import AppConfig
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from .models import (
+    AppConfig,
+    AuthConfig,
+    StorageConfig,
+    ResponseConfig,
+    FeatureConfig,
+    AzureConfig,
+    StorageType,
+    ResponseFormat,
+)
+from . import _filecache
+from ..utils import jsonutil
 from ..core.errors import ConfigError
 
+# Accepted spellings of a true boolean environment variable
+_TRUE = frozenset(('true', 'TRUE', 'True', '1', 'yes', 'YES', 'on', 'ON'))
+_to_bool = _TRUE.__contains__
+
+def _to_list(value: str) -> List[str]:
+    """Split a comma-separated environment variable, dropping empty items."""
+    return [item for item in map(str.strip, value.split(',')) if item]
+
+# Environment variables: (variable, section, field, caster). Later
+# entries win, so legacy names come before the names that replace them.
+_ENV_SPEC = (
+    # Legacy names, formerly read by app.core.config.DynamicConfig
+    ('STORAGE_PATH', 'storage', 'local_path', str),
+    ('S3_BUCKET', 'storage', 's3_bucket', str),
+    ('S3_ENDPOINT', 'storage', 's3_endpoint', str),
+    ('OCR_ENABLED', 'features', 'enable_ocr', _to_bool),
+    # Auth config
+    ('ADMIN_USER', 'auth', 'admin_user', str),
+    ('ADMIN_PASSWORD', 'auth', 'admin_password', str),
+    ('REQUIRE_AUTH', 'auth', 'require_auth', _to_bool),
+    ('JWT_SECRET_KEY', 'auth', 'jwt_secret', str),
+    ('WHITELIST_IPS', 'auth', 'whitelist_ips', _to_list),
+    ('WHITELIST_DOMAINS', 'auth', 'whitelist_domains', _to_list),
+    # Storage config
+    ('STORAGE_TYPE', 'storage', 'type', str),
+    ('LOCAL_STORAGE_PATH', 'storage', 'local_path', str),
+    ('LOCAL_STORAGE_DOMAIN', 'storage', 'local_domain', str),
+    # S3 config
+    ('S3_ACCESS_KEY', 'storage', 's3_access_key', str),
+    ('S3_SECRET_KEY', 'storage', 's3_secret_key', str),
+    ('S3_BUCKET_NAME', 'storage', 's3_bucket', str),
+    ('S3_ENDPOINT_URL', 'storage', 's3_endpoint', str),
+    ('S3_REGION_NAME', 'storage', 's3_region', str),
+    # Feature flags
+    ('ENABLE_OCR', 'features', 'enable_ocr', _to_bool),
+    ('ENABLE_VISION', 'features', 'enable_vision', _to_bool),
+    ('ENABLE_SPEECH', 'features', 'enable_speech', _to_bool),
+    # Azure config
+    ('AZURE_SPEECH_KEY', 'azure', 'speech_key', str),
+    ('AZURE_SPEECH_REGION', 'azure', 'speech_region', str),
+)
+_ENV_KEYS = tuple(spec[0] for spec in _ENV_SPEC)
+
+# Config sections and the enum-typed field each one carries
+_SECTION_ENUMS = {
+    'auth': None,
+    'storage': ('type', StorageType),
+    'response': ('format', ResponseFormat),
+    'features': None,
+    'azure': None,
+}
+
+def _section_schema(name: str, cls: type) -> Tuple[str, Tuple[str, ...], Callable]:
+    """Build the (section, field names, getter) entry for a config section."""
+    keys = tuple(f.name for f in fields(cls))
+    return name, keys, attrgetter(*keys)
+
+# Config sections as (section, field names, getter) for _config_to_dict
+_SECTION_SCHEMA = (
+    _section_schema('auth', AuthConfig),
+    _section_schema('storage', StorageConfig),
+    _section_schema('response', ResponseConfig),
+    _section_schema('features', FeatureConfig),
+    _section_schema('azure', AzureConfig),
+)
+
+# Enum members mapped to their serialized values
+_STORAGE_TYPE_VALUES = {member: member.value for member in StorageType}
+_RESPONSE_FORMAT_VALUES = {member: member.value for member in ResponseFormat}
+
+# Top-level keys accepted by update()
+_UPDATE_KEYS = frozenset(_SECTION_ENUMS) | {'cors_origins', 'debug'}
+
 class ConfigManager:
     """Configuration manager."""
     
@@ -20,36 +106,54 @@ class ConfigManager:
         self.config_dir = Path(config_dir)
         self.config_file = self.config_dir / "config.json"
         self._config: Optional[AppConfig] = None
+        self._config_dict_cache: Optional[Tuple[AppConfig, Dict[str, Any]]] = None
+        self._load_fingerprint: Optional[Tuple[Any, ...]] = None
         
     def load(self) -> AppConfig:
         """Load configuration from all sources.
         
+        The existing configuration is returned as-is when the environment
+        and config file are unchanged since the last load.
+        
         Returns:
             AppConfig instance
         
         Raises:
             ConfigError: If configuration is invalid
         """
-        # Load config in order: defaults -> env -> file
-        config_data = {}
+        # Skip the rebuild if neither env nor file changed since last load
+        env = os.environ
+        try:
+            st = os.stat(self.config_file)
+            file_key = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            st = file_key = None
+        fingerprint = (tuple(map(env.get, _ENV_KEYS)), file_key)
+        if self._config is not None and fingerprint == self._load_fingerprint:
+            return self._config
         
+        # Load config in order: defaults -> env -> file
         # 1. Load environment variables
-        config_data.update(self._load_from_env())
+        env_data = self._load_from_env()
         
         # 2. Load from file if exists
-        if self.config_file.exists():
+        file_data = {}
+        if file_key is not None:
             try:
-                with open(self.config_file) as f:
-                    file_data = json.load(f)
-                config_data.update(file_data)
+                file_data = _filecache.get(self.config_file, st)
             except Exception as e:
                 raise ConfigError(f"Failed to load config file: {e}")
         
+        # File values take precedence over env without merging copies
+        config_data = ChainMap(file_data, env_data)
+        
         # 3. Create config instance
         try:
             self._config = AppConfig.from_dict(config_data)
+            self._config_dict_cache = None
         except Exception as e:
             raise ConfigError(f"Invalid configuration: {e}")
+        self._load_fingerprint = fingerprint
             
         return self._config
     
@@ -70,27 +174,32 @@ class ConfigManager:
             config_data = self._config_to_dict(self._config)
             
             # Save to file
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            _filecache.write_atomic(self.config_file, jsonutil.dumps(config_data, indent=True))
         except Exception as e:
             raise ConfigError(f"Failed to save config: {e}")
     
     def get_config(self) -> AppConfig:
         """Get current configuration.
         
+        Configuration is loaded on first access and reused afterwards.
+        
         Returns:
             AppConfig instance
             
         Raises:
-            ConfigError: If no configuration is loaded
+            ConfigError: If configuration cannot be loaded
         """
-        if not self._config:
-            raise ConfigError("No configuration loaded")
+        if self._config is None:
+            return self.load()
         return self._config
     
     def update(self, data: Dict[str, Any]) -> AppConfig:
         """Update configuration with new data.
         
+        Fields inside a section are merged into the current section, so
+        ``{'auth': {'admin_user': 'admin'}}`` leaves the other auth fields
+        untouched.
+        
         Args:
             data: New configuration data
             
@@ -98,18 +207,32 @@ class ConfigManager:
             Updated AppConfig instance
             
         Raises:
-            ConfigError: If update fails
+            ConfigError: If update fails or contains unknown keys
         """
         if not self._config:
             raise ConfigError("No configuration loaded")
             
-        try:
-            # Merge new data with existing config
-            config_dict = self._config_to_dict(self._config)
-            config_dict.update(data)
+        unknown = data.keys() - _UPDATE_KEYS
+        if unknown:
+            raise ConfigError(f"Unknown configuration keys: {', '.join(sorted(unknown))}")
             
-            # Create new config instance
-            self._config = AppConfig.from_dict(config_dict)
+        try:
+            # Replace only the sections present in the update
+            changes = {}
+            for key, value in data.items():
+                if key not in _SECTION_ENUMS:
+                    changes[key] = value
+                    continue
+                value = dict(value)
+                enum_field = _SECTION_ENUMS[key]
+                if enum_field is not None and enum_field[0] in value:
+                    name, enum_type = enum_field
+                    value[name] = enum_type(value[name])
+                changes[key] = replace(getattr(self._config, key), **value)
+                
+            self._config = replace(self._config, **changes)
+            self._config_dict_cache = None
+            self._load_fingerprint = None
             return self._config
         except Exception as e:
             raise ConfigError(f"Failed to update config: {e}")
@@ -120,104 +243,38 @@ class ConfigManager:
         Returns:
             Dictionary of configuration values from environment
         """
+        env = os.environ
         config = {}
-        
-        # Auth config
-        if admin_user := os.environ.get('ADMIN_USER'):
-            config.setdefault('auth', {})['admin_user'] = admin_user
-        if admin_pass := os.environ.get('ADMIN_PASSWORD'):
-            config.setdefault('auth', {})['admin_password'] = admin_pass
-        if require_auth := os.environ.get('REQUIRE_AUTH'):
-            config.setdefault('auth', {})['require_auth'] = require_auth.lower() == 'true'
-            
-        # Storage config
-        if storage_type := os.environ.get('STORAGE_TYPE'):
-            config.setdefault('storage', {})['type'] = storage_type
-        if storage_path := os.environ.get('LOCAL_STORAGE_PATH'):
-            config.setdefault('storage', {})['local_path'] = storage_path
-        if storage_domain := os.environ.get('LOCAL_STORAGE_DOMAIN'):
-            config.setdefault('storage', {})['local_domain'] = storage_domain
-            
-        # S3 config
-        if s3_key := os.environ.get('S3_ACCESS_KEY'):
-            config.setdefault('storage', {})['s3_access_key'] = s3_key
-        if s3_secret := os.environ.get('S3_SECRET_KEY'):
-            config.setdefault('storage', {})['s3_secret_key'] = s3_secret
-        if s3_bucket := os.environ.get('S3_BUCKET_NAME'):
-            config.setdefault('storage', {})['s3_bucket'] = s3_bucket
-        if s3_endpoint := os.environ.get('S3_ENDPOINT_URL'):
-            config.setdefault('storage', {})['s3_endpoint'] = s3_endpoint
-        if s3_region := os.environ.get('S3_REGION_NAME'):
-            config.setdefault('storage', {})['s3_region'] = s3_region
-            
-        # Feature flags
-        if enable_ocr := os.environ.get('ENABLE_OCR'):
-            config.setdefault('features', {})['enable_ocr'] = enable_ocr.lower() == 'true'
-        if enable_vision := os.environ.get('ENABLE_VISION'):
-            config.setdefault('features', {})['enable_vision'] = enable_vision.lower() == 'true'
-        if enable_speech := os.environ.get('ENABLE_SPEECH'):
-            config.setdefault('features', {})['enable_speech'] = enable_speech.lower() == 'true'
-            
-        # Azure config
-        if speech_key := os.environ.get('AZURE_SPEECH_KEY'):
-            config.setdefault('azure', {})['speech_key'] = speech_key
-        if speech_region := os.environ.get('AZURE_SPEECH_REGION'):
-            config.setdefault('azure', {})['speech_region'] = speech_region
-            
+        for key, section, name, cast in _ENV_SPEC:
+            value = env.get(key)
+            if value:
+                config.setdefault(section, {})[name] = cast(value)
         return config
     
     def _config_to_dict(self, config: AppConfig) -> Dict[str, Any]:
         """Convert AppConfig to dictionary.
         
+        The result for the current configuration is cached until the
+        configuration is replaced, and must not be mutated.
+        
         Args:
             config: AppConfig instance
             
         Returns:
             Dictionary representation of config
         """
-        return {
-            'auth': {
-                'admin_user': config.auth.admin_user,
-                'admin_password': config.auth.admin_password,
-                'require_auth': config.auth.require_auth,
-                'whitelist_domains': config.auth.whitelist_domains,
-                'whitelist_ips': config.auth.whitelist_ips,
-                'jwt_secret': config.auth.jwt_secret,
-                'jwt_expires': config.auth.jwt_expires,
-            },
-            'storage': {
-                'type': config.storage.type.value,
-                'local_path': config.storage.local_path,
-                'local_domain': config.storage.local_domain,
-                's3_access_key': config.storage.s3_access_key,
-                's3_secret_key': config.storage.s3_secret_key,
-                's3_bucket': config.storage.s3_bucket,
-                's3_endpoint': config.storage.s3_endpoint,
-                's3_region': config.storage.s3_region,
-                's3_sign_version': config.storage.s3_sign_version,
-                'max_file_size': config.storage.max_file_size,
-            },
-            'response': {
-                'format': config.response.format.value,
-                'code_field': config.response.code_field,
-                'message_field': config.response.message_field,
-                'data_field': config.response.data_field,
-                'success_code': config.response.success_code,
-                'error_code': config.response.error_code,
-                'url_field': config.response.url_field,
-                'filename_field': config.response.filename_field,
-                'image_field': config.response.image_field,
-            },
-            'features': {
-                'enable_ocr': config.features.enable_ocr,
-                'enable_vision': config.features.enable_vision,
-                'enable_speech': config.features.enable_speech,
-                'pdf_max_images': config.features.pdf_max_images,
-            },
-            'azure': {
-                'speech_key': config.azure.speech_key,
-                'speech_region': config.azure.speech_region,
-            },
-            'cors_origins': config.cors_origins,
-            'debug': config.debug,
+        cached = self._config_dict_cache
+        if cached is not None and cached[0] is config:
+            return cached[1]
+            
+        data = {
+            name: dict(zip(keys, getter(getattr(config, name))))
+            for name, keys, getter in _SECTION_SCHEMA
         }
+        data['storage']['type'] = _STORAGE_TYPE_VALUES[config.storage.type]
+        data['response']['format'] = _RESPONSE_FORMAT_VALUES[config.response.format]
+        data['cors_origins'] = config.cors_origins
+        data['debug'] = config.debug
+        if config is self._config:
+            self._config_dict_cache = (config, data)
+        return data
@@ -4,6 +4,7 @@ Configuration models.
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
 from enum import Enum
+from ..utils.compat import DATACLASS_OPTIONS
 
 class StorageType(str, Enum):
     """Storage backend types."""
@@ -17,7 +18,7 @@ class ResponseFormat(str, Enum):
     LEGACY = "legacy"
     CUSTOM = "custom"
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class AuthConfig:
     """Authentication configuration."""
     admin_user: str = "root"
@@ -28,7 +29,7 @@ class AuthConfig:
     jwt_secret: Optional[str] = None
     jwt_expires: int = 3600
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class StorageConfig:
     """Storage configuration."""
     type: StorageType = StorageType.LOCAL
@@ -42,7 +43,7 @@ class StorageConfig:
     s3_sign_version: Optional[str] = None
     max_file_size: int = -1
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class ResponseConfig:
     """Response format configuration."""
     format: ResponseFormat = ResponseFormat.STANDARD
@@ -55,7 +56,7 @@ class ResponseConfig:
     filename_field: str = "filename"
     image_field: str = "image"
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class FeatureConfig:
     """Feature flags configuration."""
     enable_ocr: bool = False
@@ -63,13 +64,13 @@ class FeatureConfig:
     enable_speech: bool = False
     pdf_max_images: int = 10
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class AzureConfig:
     """Azure services configuration."""
     speech_key: str = ""
     speech_region: str = ""
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_OPTIONS)
 class AppConfig:
     """Application configuration."""
     auth: AuthConfig = field(default_factory=AuthConfig)
@@ -90,24 +91,25 @@ class AppConfig:
         Returns:
             AppConfig instance
         """
-        auth_data = data.get('auth', {})
-        storage_data = data.get('storage', {})
-        response_data = data.get('response', {})
-        features_data = data.get('features', {})
-        azure_data = data.get('azure', {})
+        storage_data = data.get('storage')
+        if storage_data and 'type' in storage_data:
+            storage_data = {**storage_data, 'type': StorageType(storage_data['type'])}
+        response_data = data.get('response')
+        if response_data and 'format' in response_data:
+            response_data = {**response_data, 'format': ResponseFormat(response_data['format'])}
         
         return cls(
-            auth=AuthConfig(**auth_data),
-            storage=StorageConfig(
-                type=StorageType(storage_data.get('type', 'local')),
-                **{k: v for k, v in storage_data.items() if k != 'type'}
-            ),
-            response=ResponseConfig(
-                format=ResponseFormat(response_data.get('format', 'standard')),
-                **{k: v for k, v in response_data.items() if k != 'format'}
-            ),
-            features=FeatureConfig(**features_data),
-            azure=AzureConfig(**azure_data),
+            auth=_build_section(AuthConfig, data.get('auth')),
+            storage=_build_section(StorageConfig, storage_data),
+            response=_build_section(ResponseConfig, response_data),
+            features=_build_section(FeatureConfig, data.get('features')),
+            azure=_build_section(AzureConfig, data.get('azure')),
             cors_origins=data.get('cors_origins', ["*"]),
             debug=data.get('debug', False)
         )
+
+def _build_section(section_cls: type, values: Optional[Dict[str, Any]]) -> Any:
+    """Create a config section, using defaults when no values are given."""
+    if not values:
+        return section_cls()
+    return section_cls(**values)
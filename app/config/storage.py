@@ -172,6 +172,9 @@ STORAGE_BACKENDS = {
     'sftp': 'app.storage.sftp.SFTPStorage'
 }
 
+# Supported backend names, for membership checks
+STORAGE_BACKEND_NAMES = frozenset(STORAGE_BACKENDS)
+
 # Storage error codes
 class StorageErrorCode:
     SUCCESS = 0
@@ -217,6 +220,17 @@ class StorageError(Exception):
         self.message = message or STORAGE_ERROR_MESSAGES.get(code, 'Unknown error')
         super().__init__(self.message)
 
+# Numeric common settings and their (min, max) bounds
+_NUMERIC_LIMITS = {
+    'timeout': (0, None),
+    'max_retries': (0, None),
+    'retry_delay': (0, None),
+    'chunk_size': (0, None),
+    'multipart_threshold': (0, None),
+    'multipart_chunksize': (0, None)
+}
+_NUMERIC_KEYS = frozenset(_NUMERIC_LIMITS)
+
 def validate_storage_config(config: Dict[str, Any]) -> None:
     """Validate storage configuration.
     
@@ -232,7 +246,7 @@ def validate_storage_config(config: Dict[str, Any]) -> None:
             raise StorageError(StorageErrorCode.INVALID_CONFIG, 'Missing backend type')
         
         # Check backend type
-        if config['backend'] not in STORAGE_BACKENDS:
+        if config['backend'] not in STORAGE_BACKEND_NAMES:
             raise StorageError(
                 StorageErrorCode.INVALID_CONFIG,
                 f"Unsupported backend type: {config['backend']}"
@@ -246,34 +260,26 @@ def validate_storage_config(config: Dict[str, Any]) -> None:
                 f"Missing configuration for backend: {config['backend']}"
             )
         
-        # Validate common settings
-        numeric_fields = {
-            'timeout': (0, None),
-            'max_retries': (0, None),
-            'retry_delay': (0, None),
-            'chunk_size': (0, None),
-            'multipart_threshold': (0, None),
-            'multipart_chunksize': (0, None)
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
-            if field in config:
-                value = config[field]
-                if not isinstance(value, (int, float)):
-                    raise StorageError(
-                        StorageErrorCode.INVALID_CONFIG,
-                        f"Invalid type for {field}: {type(value)}"
-                    )
-                if min_val is not None and value < min_val:
-                    raise StorageError(
-                        StorageErrorCode.INVALID_CONFIG,
-                        f"{field} must be >= {min_val}"
-                    )
-                if max_val is not None and value > max_val:
-                    raise StorageError(
-                        StorageErrorCode.INVALID_CONFIG,
-                        f"{field} must be <= {max_val}"
-                    )
+        # Validate common settings that are present
+        for field in _NUMERIC_KEYS & config.keys():
+            value = config[field]
+            value_type = type(value)
+            if value_type is not int and value_type is not float:
+                raise StorageError(
+                    StorageErrorCode.INVALID_CONFIG,
+                    f"Invalid type for {field}: {value_type}"
+                )
+            min_val, max_val = _NUMERIC_LIMITS[field]
+            if min_val is not None and value < min_val:
+                raise StorageError(
+                    StorageErrorCode.INVALID_CONFIG,
+                    f"{field} must be >= {min_val}"
+                )
+            if max_val is not None and value > max_val:
+                raise StorageError(
+                    StorageErrorCode.INVALID_CONFIG,
+                    f"{field} must be <= {max_val}"
+                )
         
     except StorageError:
         raise
@@ -3,24 +3,25 @@ Core configuration management.
 """
 from typing import Dict, Any, Optional, List
 from pydantic_settings import BaseSettings
-from pydantic import Field
-import json
+from pydantic import Field, PrivateAttr
 import os
+import asyncio
 from pathlib import Path
 import logging
 from datetime import datetime
+from operator import attrgetter
+from ..config import _filecache, config_manager
+from ..utils import jsonutil
+from ..utils.lazy import LazySingleton, lazy_module_getattr
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for further updates before writing dynamic config
+SAVE_DEBOUNCE = 0.2
+
 class DynamicConfig(BaseSettings):
     """Dynamic configuration that can be updated at runtime"""
     
-    # Storage settings
-    storage_type: str = Field(default="local", env="STORAGE_TYPE")
-    storage_path: str = Field(default="./data", env="STORAGE_PATH")
-    s3_bucket: Optional[str] = Field(None, env="S3_BUCKET")
-    s3_endpoint: Optional[str] = Field(None, env="S3_ENDPOINT")
-    
     # Processing settings
     max_file_size: int = Field(default=10*1024*1024, env="MAX_FILE_SIZE")  # 10MB
     allowed_extensions: List[str] = Field(
@@ -28,11 +29,8 @@ class DynamicConfig(BaseSettings):
         env="ALLOWED_EXTENSIONS"
     )
     extract_text_enabled: bool = Field(default=True, env="EXTRACT_TEXT_ENABLED")
-    ocr_enabled: bool = Field(default=False, env="OCR_ENABLED")
     
     # Security settings
-    whitelist_ips: List[str] = Field(default=[], env="WHITELIST_IPS")
-    whitelist_domains: List[str] = Field(default=[], env="WHITELIST_DOMAINS")
     rate_limit_enabled: bool = Field(default=True, env="RATE_LIMIT_ENABLED")
     rate_limit_per_minute: int = Field(default=60, env="RATE_LIMIT_PER_MINUTE")
     
@@ -46,9 +44,52 @@ class DynamicConfig(BaseSettings):
         env="RESPONSE_FORMAT"
     )
     
+    # Shared settings changed at runtime, saved alongside the dynamic config
+    _shared_overrides: Dict[str, Any] = PrivateAttr(default_factory=dict)
+    
+    # Pending write state
+    _dirty: bool = PrivateAttr(default=False)
+    _writer_task: Optional[asyncio.Task] = PrivateAttr(default=None)
+    
     class Config:
         env_file = ".env"
         
+    # Settings shared with the application config, read from there
+    @property
+    def storage_type(self) -> str:
+        """Storage backend type"""
+        return config_manager.get_config().storage.type.value
+        
+    @property
+    def storage_path(self) -> str:
+        """Local storage path"""
+        return config_manager.get_config().storage.local_path
+        
+    @property
+    def s3_bucket(self) -> Optional[str]:
+        """S3 bucket name"""
+        return config_manager.get_config().storage.s3_bucket or None
+        
+    @property
+    def s3_endpoint(self) -> Optional[str]:
+        """S3 endpoint URL"""
+        return config_manager.get_config().storage.s3_endpoint or None
+        
+    @property
+    def ocr_enabled(self) -> bool:
+        """Whether OCR is enabled"""
+        return config_manager.get_config().features.enable_ocr
+        
+    @property
+    def whitelist_ips(self) -> List[str]:
+        """Whitelisted client IPs"""
+        return config_manager.get_config().auth.whitelist_ips
+        
+    @property
+    def whitelist_domains(self) -> List[str]:
+        """Whitelisted domains"""
+        return config_manager.get_config().auth.whitelist_domains
+        
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._load_dynamic_config()
@@ -57,18 +98,44 @@ class DynamicConfig(BaseSettings):
         """Load dynamic configuration from file"""
         config_path = Path("config/dynamic.json")
         try:
-            if config_path.exists():
-                with open(config_path) as f:
-                    dynamic_config = json.load(f)
-                    for key, value in dynamic_config.items():
-                        if hasattr(self, key):
-                            setattr(self, key, value)
+            dynamic_config = _filecache.get(config_path)
+        except FileNotFoundError:
+            return
         except Exception as e:
             logger.error(f"Error loading dynamic config: {e}")
+            return
+            
+        shared = {}
+        for key, value in dynamic_config.items():
+            if key in _PUBLIC_FIELDS:
+                setattr(self, key, value)
+            elif key in _SHARED_FIELDS:
+                # Shared settings, also written by older versions of this file
+                self._shared_overrides[key] = value
+                section, field = _SHARED_FIELDS[key]
+                shared.setdefault(section, {})[field] = value
+            elif key != "_updated_at":
+                logger.warning(f"Ignoring unknown dynamic config key: {key}")
+                
+        if shared:
+            try:
+                config_manager.get_config()
+                config_manager.update(shared)
+            except Exception as e:
+                logger.error(f"Error applying shared dynamic config: {e}")
             
     async def update(self, updates: Dict[str, Any]) -> bool:
         """Update dynamic configuration
         
+        Updates are applied in memory immediately. Writes to disk are
+        coalesced, so updates arriving within ``SAVE_DEBOUNCE`` seconds
+        of each other are saved together; call ``flush`` to save now.
+        
+        Shared settings (storage and whitelists) are applied to the
+        application config, but modules that resolve it at import, such
+        as ``app.api.deps`` and ``app.api.routes``, only see them after
+        a restart.
+        
         Args:
             updates: Dictionary of configuration updates
             
@@ -78,38 +145,78 @@ class DynamicConfig(BaseSettings):
         try:
             # Validate updates
             for key, value in updates.items():
-                if not hasattr(self, key):
+                if key not in _PUBLIC_FIELDS and key not in _SHARED_FIELDS:
                     raise ValueError(f"Invalid configuration key: {key}")
                     
-            # Apply updates
+            # Apply shared settings to the application config
+            shared = {}
+            local = {}
             for key, value in updates.items():
+                if key in _SHARED_FIELDS:
+                    section, field = _SHARED_FIELDS[key]
+                    shared.setdefault(section, {})[field] = value
+                else:
+                    local[key] = value
+            if shared:
+                config_manager.get_config()
+                config_manager.update(shared)
+                
+            # Apply updates; shared settings are saved with the dynamic
+            # config so env-sourced values are never written to disk
+            for key, value in local.items():
                 setattr(self, key, value)
+            for key, value in updates.items():
+                if key in _SHARED_FIELDS:
+                    self._shared_overrides[key] = value
                 
-            # Save to file
-            await self._save_dynamic_config()
+            # Schedule save to file
+            self._dirty = True
+            if self._writer_task is None or self._writer_task.done():
+                self._writer_task = asyncio.create_task(self._flush_pending())
             return True
         except Exception as e:
             logger.error(f"Error updating config: {e}")
             return False
             
+    async def _flush_pending(self):
+        """Save dynamic configuration once updates stop arriving"""
+        while self._dirty:
+            await asyncio.sleep(SAVE_DEBOUNCE)
+            self._dirty = False
+            try:
+                await self._save_dynamic_config()
+            except Exception as e:
+                logger.error(f"Error saving dynamic config: {e}")
+                
+    async def flush(self):
+        """Save any pending configuration updates immediately"""
+        task = self._writer_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._dirty:
+            self._dirty = False
+            await self._save_dynamic_config()
+            
     async def _save_dynamic_config(self):
         """Save dynamic configuration to file"""
         config_path = Path("config/dynamic.json")
         config_path.parent.mkdir(exist_ok=True)
         
         # Get dynamic config as dict
-        config_dict = {
-            key: getattr(self, key)
-            for key in self.__fields__
-            if not key.startswith("_")
-        }
+        config_dict = dict(zip(_PUBLIC_FIELDS, _PUBLIC_GETTER(self)))
+        config_dict.update(self._shared_overrides)
         
         # Add metadata
         config_dict["_updated_at"] = datetime.utcnow().isoformat()
         
-        # Save to file
-        with open(config_path, "w") as f:
-            json.dump(config_dict, f, indent=2)
+        # Save to file without blocking the event loop on fsync
+        await asyncio.to_thread(
+            _filecache.write_atomic, config_path, jsonutil.dumps(config_dict, indent=True)
+        )
             
     def get_storage_config(self) -> Dict[str, Any]:
         """Get storage configuration"""
@@ -138,5 +245,31 @@ class DynamicConfig(BaseSettings):
             "ocr_enabled": self.ocr_enabled
         }
 
-# Create global config instance
-config = DynamicConfig()
+# Settings owned by the application config, as (section, field)
+_SHARED_FIELDS = {
+    "storage_type": ("storage", "type"),
+    "storage_path": ("storage", "local_path"),
+    "s3_bucket": ("storage", "s3_bucket"),
+    "s3_endpoint": ("storage", "s3_endpoint"),
+    "ocr_enabled": ("features", "enable_ocr"),
+    "whitelist_ips": ("auth", "whitelist_ips"),
+    "whitelist_domains": ("auth", "whitelist_domains"),
+}
+
+# Public fields saved to the dynamic config file
+_PUBLIC_FIELDS = tuple(
+    key for key in DynamicConfig.model_fields if not key.startswith("_")
+)
+_PUBLIC_GETTER = attrgetter(*_PUBLIC_FIELDS)
+
+# Global config instance, created on first access
+get_config = LazySingleton(DynamicConfig)
+
+async def flush() -> None:
+    """Save pending dynamic config updates, if the config was created."""
+    config = get_config.peek()
+    if config is not None:
+        await config.flush()
+
+# Resolve the ``config`` attribute lazily
+__getattr__ = lazy_module_getattr(__name__, {"config": get_config})
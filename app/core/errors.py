@@ -26,6 +26,11 @@ class ErrorCode(str, Enum):
 class AppError(Exception):
     """Base application error."""
     
+    __slots__ = ("message", "code", "http_status", "details")
+    
+    # Whether from_exception() copies the formatted traceback into details
+    INCLUDE_TRACEBACK = False
+    
     def __init__(
         self,
         message: str,
@@ -78,24 +83,27 @@ class AppError(Exception):
         """
         # Get exception details
         exc_type = type(exc).__name__
-        exc_tb = traceback.format_exc()
+        details = {"type": exc_type}
+        if cls.INCLUDE_TRACEBACK:
+            details["traceback"] = "".join(
+                traceback.format_exception(type(exc), exc, exc.__traceback__)
+            )
         
-        # Log full traceback
-        logger.error(f"Exception {exc_type}: {str(exc)}\n{exc_tb}")
+        # Log full traceback, formatted by the logging handler
+        logger.error("Exception %s: %s", exc_type, exc, exc_info=exc)
         
         return cls(
             message=str(exc),
             code=code,
             http_status=http_status,
-            details={
-                "type": exc_type,
-                "traceback": exc_tb
-            }
+            details=details
         )
 
 class ConfigError(AppError):
     """Configuration error."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -111,6 +119,8 @@ class ConfigError(AppError):
 class AuthError(AppError):
     """Authentication/authorization error."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -126,6 +136,8 @@ class AuthError(AppError):
 class ValidationError(AppError):
     """Data validation error."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -141,6 +153,8 @@ class ValidationError(AppError):
 class NotFoundError(AppError):
     """Resource not found error."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -156,6 +170,8 @@ class NotFoundError(AppError):
 class PermissionError(AppError):
     """Permission denied error."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -171,6 +187,8 @@ class PermissionError(AppError):
 class RateLimitError(AppError):
     """Rate limit exceeded error."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -186,6 +204,8 @@ class RateLimitError(AppError):
 class StorageError(AppError):
     """Storage operation error."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -201,6 +221,8 @@ class StorageError(AppError):
 class ProcessingError(AppError):
     """File processing error."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -216,6 +238,8 @@ class ProcessingError(AppError):
 class OCRError(AppError):
     """OCR processing error."""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         message: str,
@@ -241,6 +265,9 @@ _error_handlers: Dict[Type[Exception], Type[AppError]] = {
     OCRError: OCRError,
 }
 
+# Handlers resolved through the MRO, memoized by exact exception type
+_resolved_handlers: Dict[Type[Exception], Optional[Type[AppError]]] = {}
+
 def register_error_handler(
     exc_type: Type[Exception],
     handler: Type[AppError]
@@ -252,6 +279,29 @@ def register_error_handler(
         handler: AppError subclass to handle the exception
     """
     _error_handlers[exc_type] = handler
+    _resolved_handlers.clear()
+
+def _resolve_handler(exc_type: Type[Exception]) -> Optional[Type[AppError]]:
+    """Find the handler for an exception type or its nearest base class.
+    
+    Args:
+        exc_type: Exception type
+        
+    Returns:
+        AppError subclass, or None if no handler is registered
+    """
+    try:
+        return _resolved_handlers[exc_type]
+    except KeyError:
+        pass
+        
+    handler = None
+    for base in exc_type.__mro__:
+        handler = _error_handlers.get(base)
+        if handler is not None:
+            break
+    _resolved_handlers[exc_type] = handler
+    return handler
 
 def handle_error(exc: Exception) -> AppError:
     """Convert exception to AppError.
@@ -262,8 +312,8 @@ def handle_error(exc: Exception) -> AppError:
     Returns:
         AppError instance
     """
-    # Get handler for exception type
-    handler = _error_handlers.get(type(exc))
+    # Get handler for exception type or its nearest registered base
+    handler = _resolve_handler(type(exc))
     
     if handler and isinstance(exc, AppError):
         # Already an AppError, return as is
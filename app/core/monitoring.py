@@ -1,11 +1,14 @@
 """
 Performance monitoring and metrics collection.
 """
-import time
+import asyncio
+from time import perf_counter
 import logging
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Optional, Tuple
 from functools import wraps
-from prometheus_client import Counter, Histogram, Gauge
+import os
+from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, REGISTRY
+from prometheus_client import multiprocess
 import psutil
 from fastapi import Request
 from app.core.config import config
@@ -43,16 +46,72 @@ STORAGE_OPERATIONS = Counter(
     ['operation', 'status']
 )
 
+# System gauges report the same host from every worker
 SYSTEM_MEMORY = Gauge(
     'system_memory_usage_bytes',
-    'System memory usage'
+    'System memory usage',
+    multiprocess_mode='livemax'
 )
 
 SYSTEM_CPU = Gauge(
     'system_cpu_usage_percent',
-    'System CPU usage'
+    'System CPU usage',
+    multiprocess_mode='livemax'
 )
 
+def get_metrics_registry() -> CollectorRegistry:
+    """Get the registry to expose metrics from.
+    
+    With ``PROMETHEUS_MULTIPROC_DIR`` set, every worker process records
+    into its own mmap-backed files and the returned registry aggregates
+    them; otherwise this is the default in-process registry.
+    
+    Returns:
+        Collector registry
+    """
+    if not os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+def mark_worker_dead():
+    """Remove this worker's live gauge samples in multiprocess mode.
+    
+    Called when the worker shuts down, so ``livemax`` gauges stop
+    reporting values from a process that no longer exists.
+    """
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        multiprocess.mark_process_dead(os.getpid())
+
+# Labelled children cached by label values; .labels() locks on every call
+_REQUEST_COUNT_CHILDREN: Dict[Tuple[str, str, int], Any] = {}
+_REQUEST_LATENCY_CHILDREN: Dict[Tuple[str, str], Any] = {}
+_UPLOAD_SIZE_CHILDREN: Dict[str, Any] = {}
+
+def _request_count(method: str, endpoint: str, status: int) -> Any:
+    """Get the request counter child for a label set."""
+    key = (method, endpoint, status)
+    child = _REQUEST_COUNT_CHILDREN.get(key)
+    if child is None:
+        child = _REQUEST_COUNT_CHILDREN[key] = REQUEST_COUNT.labels(
+            method=method,
+            endpoint=endpoint,
+            status=status
+        )
+    return child
+
+def _request_latency(method: str, endpoint: str) -> Any:
+    """Get the request latency child for a label set."""
+    key = (method, endpoint)
+    child = _REQUEST_LATENCY_CHILDREN.get(key)
+    if child is None:
+        child = _REQUEST_LATENCY_CHILDREN[key] = REQUEST_LATENCY.labels(
+            method=method,
+            endpoint=endpoint
+        )
+    return child
+
 def monitor_request() -> Callable:
     """Request monitoring decorator."""
     def decorator(func: Callable) -> Callable:
@@ -62,7 +121,7 @@ def monitor_request() -> Callable:
             method = request.method
             endpoint = request.url.path
             
-            start_time = time.time()
+            start_time = perf_counter()
             try:
                 response = await func(*args, **kwargs)
                 status = response.status_code
@@ -71,16 +130,8 @@ def monitor_request() -> Callable:
                 status = getattr(e, 'status_code', 500)
                 raise
             finally:
-                duration = time.time() - start_time
-                REQUEST_COUNT.labels(
-                    method=method,
-                    endpoint=endpoint,
-                    status=status
-                ).inc()
-                REQUEST_LATENCY.labels(
-                    method=method,
-                    endpoint=endpoint
-                ).observe(duration)
+                _request_latency(method, endpoint).observe(perf_counter() - start_time)
+                _request_count(method, endpoint, status).inc()
         return wrapper
     return decorator
 
@@ -92,64 +143,94 @@ def monitor_upload(func: Callable) -> Callable:
         if not file:
             return await func(*args, **kwargs)
             
-        content_type = getattr(file, 'content_type', 'unknown')
         size = getattr(file, 'size', 0)
-        
-        FILE_UPLOAD_SIZE.labels(
-            content_type=content_type
-        ).observe(size)
+        if not size:
+            return await func(*args, **kwargs)
+            
+        content_type = getattr(file, 'content_type', None) or 'unknown'
+        child = _UPLOAD_SIZE_CHILDREN.get(content_type)
+        if child is None:
+            child = _UPLOAD_SIZE_CHILDREN[content_type] = FILE_UPLOAD_SIZE.labels(
+                content_type=content_type
+            )
+        child.observe(size)
         
         return await func(*args, **kwargs)
     return wrapper
 
 def monitor_processing(processor_type: str) -> Callable:
     """File processing monitoring decorator."""
+    processing_time = PROCESSING_TIME.labels(processor_type=processor_type)
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = perf_counter()
             try:
                 result = await func(*args, **kwargs)
                 return result
             finally:
-                duration = time.time() - start_time
-                PROCESSING_TIME.labels(
-                    processor_type=processor_type
-                ).observe(duration)
+                processing_time.observe(perf_counter() - start_time)
         return wrapper
     return decorator
 
 def monitor_storage(operation: str) -> Callable:
     """Storage operation monitoring decorator."""
+    success_count = STORAGE_OPERATIONS.labels(operation=operation, status='success')
+    error_count = STORAGE_OPERATIONS.labels(operation=operation, status='error')
+    
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         async def wrapper(*args, **kwargs):
             try:
                 result = await func(*args, **kwargs)
-                STORAGE_OPERATIONS.labels(
-                    operation=operation,
-                    status='success'
-                ).inc()
+                success_count.inc()
                 return result
             except Exception as e:
-                STORAGE_OPERATIONS.labels(
-                    operation=operation,
-                    status='error'
-                ).inc()
+                error_count.inc()
                 raise
         return wrapper
     return decorator
 
+# Seconds between system metric samples
+SYSTEM_METRICS_INTERVAL = 5.0
+
+_system_metrics_task: Optional[asyncio.Task] = None
+
+def _sample_system_metrics():
+    """Sample system metrics into the gauges."""
+    # Memory usage
+    memory = psutil.virtual_memory()
+    SYSTEM_MEMORY.set(memory.used)
+    
+    # CPU usage since the previous sample
+    cpu = psutil.cpu_percent(interval=None)
+    SYSTEM_CPU.set(cpu)
+
 async def collect_system_metrics():
     """Collect system metrics."""
     try:
-        # Memory usage
-        memory = psutil.virtual_memory()
-        SYSTEM_MEMORY.set(memory.used)
-        
-        # CPU usage
-        cpu = psutil.cpu_percent()
-        SYSTEM_CPU.set(cpu)
-        
+        # psutil reads /proc synchronously, keep it off the event loop
+        await asyncio.to_thread(_sample_system_metrics)
     except Exception as e:
         logger.error(f"Error collecting system metrics: {e}")
+
+async def _refresh_system_metrics(interval: float):
+    """Collect system metrics every ``interval`` seconds."""
+    while True:
+        await collect_system_metrics()
+        await asyncio.sleep(interval)
+
+def start_system_metrics(interval: float = SYSTEM_METRICS_INTERVAL):
+    """Start refreshing system metrics in the background."""
+    global _system_metrics_task
+    if _system_metrics_task is None or _system_metrics_task.done():
+        _system_metrics_task = asyncio.create_task(_refresh_system_metrics(interval))
+
+async def stop_system_metrics():
+    """Stop the background system metrics refresh."""
+    global _system_metrics_task
+    task, _system_metrics_task = _system_metrics_task, None
+    if task is not None:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
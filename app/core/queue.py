@@ -3,11 +3,13 @@ Asynchronous task queue for file processing.
 """
 import asyncio
 import logging
-from typing import Dict, Any, Callable, Awaitable, Optional
-from datetime import datetime
-from dataclasses import dataclass
+import time
+from collections import deque
+from typing import Deque, Dict, Any, Callable, Awaitable, Optional
+from dataclasses import dataclass, field
 from enum import Enum
 from app.core.config import config
+from app.utils.compat import DATACLASS_OPTIONS
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +20,7 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Task:
     """Async task."""
     id: str
@@ -28,17 +30,26 @@ class Task:
     status: TaskStatus
     result: Optional[Any] = None
     error: Optional[str] = None
-    created_at: datetime = datetime.now()
-    updated_at: datetime = datetime.now()
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = 0.0
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Share a single clock read between both timestamps
+        if not self.updated_at:
+            self.updated_at = self.created_at
 
 class AsyncTaskQueue:
     """Asynchronous task queue."""
     
-    def __init__(self, max_workers: int = 3):
+    def __init__(self, max_workers: int = 3, max_tasks: int = 10_000):
         self.queue: asyncio.Queue[Task] = asyncio.Queue()
         self.tasks: Dict[str, Task] = {}
         self.max_workers = max_workers
+        self.max_tasks = max_tasks
         self.workers: list[asyncio.Task] = []
+        # Finished tasks in completion order, the next to be evicted first
+        self._finished: Deque[Task] = deque()
         
     async def start(self):
         """Start task queue workers."""
@@ -65,7 +76,7 @@ class AsyncTaskQueue:
                 
                 # Update task status
                 task.status = TaskStatus.PROCESSING
-                task.updated_at = datetime.now()
+                task.updated_at = time.time()
                 
                 try:
                     # Execute task
@@ -82,7 +93,9 @@ class AsyncTaskQueue:
                     task.error = str(e)
                     
                 finally:
-                    task.updated_at = datetime.now()
+                    task.updated_at = time.time()
+                    task.done.set()
+                    self._finished.append(task)
                     self.queue.task_done()
                     
             except asyncio.CancelledError:
@@ -119,14 +132,32 @@ class AsyncTaskQueue:
             status=TaskStatus.PENDING
         )
         
-        # Add to tasks dict
+        # Add to tasks dict, dropping the oldest finished tasks over the cap
+        self.tasks.pop(task_id, None)
         self.tasks[task_id] = task
+        self._evict_finished()
         
         # Add to queue
         await self.queue.put(task)
         
         return task
         
+    def _evict_finished(self):
+        """Forget the oldest finished tasks while over ``max_tasks``."""
+        tasks = self.tasks
+        finished = self._finished
+        while len(tasks) > self.max_tasks and finished:
+            task = finished.popleft()
+            # Skip tasks already replaced by a newer task with the same ID
+            if tasks.get(task.id) is task:
+                del tasks[task.id]
+                
+        # Drop replaced tasks so the deque stays bounded by the tasks kept
+        if len(finished) > 2 * self.max_tasks:
+            self._finished = deque(
+                task for task in finished if tasks.get(task.id) is task
+            )
+            
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID."""
         return self.tasks.get(task_id)
@@ -149,14 +180,10 @@ class AsyncTaskQueue:
         if not task:
             raise KeyError(f"Task {task_id} not found")
             
-        start_time = datetime.now()
-        while task.status in (TaskStatus.PENDING, TaskStatus.PROCESSING):
-            if timeout:
-                elapsed = (datetime.now() - start_time).total_seconds()
-                if elapsed > timeout:
-                    raise TimeoutError(f"Task {task_id} timed out")
-                    
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(task.done.wait(), timeout=timeout or None)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Task {task_id} timed out") from None
             
         return task
 
@@ -4,13 +4,29 @@ Core schemas for the application.
 from typing import Optional, Any, List, Dict
 from pydantic import BaseModel, Field
 from datetime import datetime
+import time
+
+# Response timestamps are shared for this many seconds
+_TIMESTAMP_RESOLUTION = 0.05
+# Last (time.time(), datetime) pair, replaced as a whole
+_last_timestamp = (0.0, datetime.utcfromtimestamp(0))
+
+def _response_timestamp() -> datetime:
+    """Current UTC time, reused across responses within the resolution"""
+    global _last_timestamp
+    now = time.time()
+    last = _last_timestamp
+    # Compare both ways so a clock stepped backwards also refreshes
+    if abs(now - last[0]) > _TIMESTAMP_RESOLUTION:
+        last = _last_timestamp = (now, datetime.utcfromtimestamp(now))
+    return last[1]
 
 class ResponseBase(BaseModel):
     """Base response model"""
     success: bool = Field(..., description="Success status")
     message: str = Field(..., description="Response message")
     data: Optional[Any] = Field(None, description="Response data")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_response_timestamp)
 
 class FileMetadata(BaseModel):
     """File metadata"""
@@ -7,6 +7,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared libmagic handle; loading the magic database is expensive
+_MIME = magic.Magic(mime=True)
+
 class SecurityValidator:
     """Security validation utilities."""
     
@@ -17,25 +20,29 @@ class SecurityValidator:
     
     ALLOWED_MIME_TYPES = {
         # Images
-        'image/jpeg': ['.jpg', '.jpeg'],
-        'image/png': ['.png'],
-        'image/gif': ['.gif'],
-        'image/webp': ['.webp'],
+        'image/jpeg': frozenset({'.jpg', '.jpeg'}),
+        'image/png': frozenset({'.png'}),
+        'image/gif': frozenset({'.gif'}),
+        'image/webp': frozenset({'.webp'}),
         # Documents
-        'application/pdf': ['.pdf'],
-        'application/msword': ['.doc'],
-        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': ['.docx'],
-        'text/plain': ['.txt'],
+        'application/pdf': frozenset({'.pdf'}),
+        'application/msword': frozenset({'.doc'}),
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': frozenset({'.docx'}),
+        'text/plain': frozenset({'.txt'}),
         # Others
-        'application/json': ['.json'],
-        'text/csv': ['.csv'],
-        'application/vnd.ms-excel': ['.xls'],
-        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': ['.xlsx']
+        'application/json': frozenset({'.json'}),
+        'text/csv': frozenset({'.csv'}),
+        'application/vnd.ms-excel': frozenset({'.xls'}),
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet': frozenset({'.xlsx'})
     }
     
-    def __init__(self):
-        self.mime = magic.Magic(mime=True)
-        
+    # Characters allowed in uploaded filenames
+    _FILENAME_RE = re.compile(r'^[\w\-. ]+\Z')
+    
+    # Uploads are read in chunks; libmagic only needs the header
+    READ_CHUNK_SIZE = 64 * 1024
+    MIME_HEADER_SIZE = 8192
+    
     @classmethod
     def validate_password(cls, password: str) -> Tuple[bool, str]:
         """
@@ -55,22 +62,28 @@ class SecurityValidator:
         Validate file type and size
         Returns: (is_valid, error_message)
         """
-        # Check file size
+        # Check file size, stopping as soon as the limit is exceeded
         file_size = 0
-        content = await file.read()
-        file_size = len(content)
+        header = b""
+        while chunk := await file.read(self.READ_CHUNK_SIZE):
+            if not header:
+                header = chunk[:self.MIME_HEADER_SIZE]
+            file_size += len(chunk)
+            if file_size > max_size:
+                break
         await file.seek(0)  # Reset file pointer
         
         if file_size > max_size:
             return False, f"File size exceeds maximum limit of {max_size} bytes"
             
         # Check file type using python-magic
-        mime_type = magic.from_buffer(content, mime=True)
+        mime_type = _MIME.from_buffer(header)
         if mime_type not in self.ALLOWED_MIME_TYPES:
             return False, f"File type {mime_type} not allowed"
             
         # Verify extension matches mime type
-        file_ext = file.filename.lower()[file.filename.rfind('.'):]
+        _, dot, ext = file.filename.rpartition('.')
+        file_ext = '.' + ext.lower() if dot else ''
         if file_ext not in self.ALLOWED_MIME_TYPES[mime_type]:
             return False, "File extension does not match its content type"
             
@@ -101,8 +114,8 @@ class SecurityValidator:
                 raise ValidationError("Invalid filename")
                 
             # Check content type
-            content = file.file.read()
-            content_type = self.mime.from_buffer(content)
+            header = file.file.read(self.MIME_HEADER_SIZE)
+            content_type = _MIME.from_buffer(header)
             if not self._is_allowed_content_type(content_type, config['allowed_types']):
                 raise ValidationError(f"File type {content_type} not allowed")
                 
@@ -116,7 +129,7 @@ class SecurityValidator:
             
     def _is_safe_filename(self, filename: str) -> bool:
         """Check if filename is safe."""
-        return bool(re.match(r'^[\w\-. ]+$', filename))
+        return bool(self._FILENAME_RE.match(filename))
         
     def _is_allowed_content_type(self, content_type: str, allowed_types: List[str]) -> bool:
         """Check if content type is allowed."""
@@ -4,9 +4,34 @@ Security configuration and validation.
 from typing import List, Optional, Dict, Tuple
 from pydantic import BaseModel, Field, validator
 import ipaddress
+import os
+import secrets
 from datetime import timedelta
+from types import MappingProxyType
 import re
 
+# Whitelisted domain, optionally with a leading wildcard label
+_DOMAIN_RE = re.compile(r'^(\*\.)?([\w\-]+\.)*[\w\-]+$')
+
+# Default Content-Security-Policy sources per directive (read-only)
+_DEFAULT_CSP = MappingProxyType({
+    "default-src": ("'self'",),
+    "script-src": ("'self'",),
+    "style-src": ("'self'",),
+    "img-src": ("'self'", "data:"),
+    "font-src": ("'self'",),
+    "connect-src": ("'self'",),
+})
+
+# Default security response headers (read-only)
+_DEFAULT_SECURE_HEADERS = MappingProxyType({
+    "X-Frame-Options": "DENY",
+    "X-Content-Type-Options": "nosniff",
+    "X-XSS-Protection": "1; mode=block",
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
+    "Referrer-Policy": "strict-origin-when-cross-origin"
+})
+
 class AuthConfig(BaseModel):
     """Authentication configuration."""
     require_auth: bool = True
@@ -74,8 +99,7 @@ class AccessControlConfig(BaseModel):
 
     @validator("whitelist_domains")
     def validate_domains(cls, v):
-        domain_pattern = re.compile(r'^(\*\.)?([\w\-]+\.)*[\w\-]+$')
-        invalid_domains = [d for d in v if not domain_pattern.match(d)]
+        invalid_domains = [d for d in v if not _DOMAIN_RE.match(d)]
         if invalid_domains:
             raise ValueError(f"Invalid domain patterns: {invalid_domains}")
         return v
@@ -90,46 +114,63 @@ class SecurityConfig(BaseModel):
     enable_response_validation: bool = True
     enable_content_security_policy: bool = True
     content_security_policy: Dict[str, List[str]] = Field(
-        default_factory=lambda: {
-            "default-src": ["'self'"],
-            "script-src": ["'self'"],
-            "style-src": ["'self'"],
-            "img-src": ["'self'", "data:"],
-            "font-src": ["'self'"],
-            "connect-src": ["'self'"],
-        }
+        default_factory=lambda: {k: list(v) for k, v in _DEFAULT_CSP.items()}
     )
     secure_headers: Dict[str, str] = Field(
-        default_factory=lambda: {
-            "X-Frame-Options": "DENY",
-            "X-Content-Type-Options": "nosniff",
-            "X-XSS-Protection": "1; mode=block",
-            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
-            "Referrer-Policy": "strict-origin-when-cross-origin"
-        }
+        default_factory=_DEFAULT_SECURE_HEADERS.copy
     )
 
     class Config:
         arbitrary_types_allowed = True
 
+def _load_jwt_secret(path: str) -> str:
+    """Load the generated JWT secret from file, creating it if missing"""
+    try:
+        with open(path) as f:
+            secret = f.read().strip()
+        if secret:
+            return secret
+    except FileNotFoundError:
+        pass
+    
+    secret = secrets.token_urlsafe(32)
+    try:
+        # O_EXCL so concurrently starting workers agree on one secret
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(path) as f:
+            return f.read().strip() or secret
+    with os.fdopen(fd, "w") as f:
+        f.write(secret)
+    return secret
+
 def load_security_config() -> SecurityConfig:
-    """Load security configuration from environment."""
+    """Load security configuration from the app config and environment."""
     from app.config import config
     
+    auth = config().auth
+    env = os.environ
+    
     auth_config = AuthConfig(
-        require_auth=config.REQUIRE_AUTH,
-        admin_user=config.ADMIN_USER,
-        admin_password=config.ADMIN_PASSWORD,
-        jwt_secret_key=config.JWT_SECRET_KEY,
-        session_timeout=config.SESSION_TIMEOUT
+        require_auth=auth.require_auth,
+        admin_user=auth.admin_user,
+        admin_password=auth.admin_password,
+        # Without JWT_SECRET_KEY, keep one generated key across restarts
+        jwt_secret_key=auth.jwt_secret or _load_jwt_secret(
+            env.get("JWT_SECRET_FILE", ".jwt_secret")
+        ),
+        session_timeout=int(env.get("SESSION_TIMEOUT", "3600"))
     )
     
     access_control = AccessControlConfig(
-        whitelist_domains=config.WHITELIST_DOMAINS,
-        whitelist_ips=config.WHITELIST_IPS,
-        cors_allow_origins=config.CORS_ALLOW_ORIGINS,
-        rate_limit_per_minute=config.RATE_LIMIT_PER_MINUTE,
-        rate_limit_burst=config.RATE_LIMIT_BURST
+        whitelist_domains=auth.whitelist_domains,
+        whitelist_ips=auth.whitelist_ips,
+        cors_allow_origins=[
+            origin for origin in map(str.strip, env.get("CORS_ALLOW_ORIGINS", "").split(","))
+            if origin
+        ],
+        rate_limit_per_minute=int(env.get("RATE_LIMIT_PER_MINUTE", "60")),
+        rate_limit_burst=int(env.get("RATE_LIMIT_BURST", "10"))
     )
     
     return SecurityConfig(
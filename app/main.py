@@ -1,12 +1,21 @@
 """
 Main application module for the Blob Service.
 """
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.middleware.security import SecurityMiddleware
 from app.middleware.auth import AuthMiddleware
 from app.core.security_config import security_config
+from app.core.monitoring import (
+    get_metrics_registry,
+    mark_worker_dead,
+    start_system_metrics,
+    stop_system_metrics,
+)
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 import logging
 import logging.config
 import os
@@ -52,11 +61,22 @@ logging.config.dictConfig({
 
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Collect system metrics in the background while the app runs."""
+    start_system_metrics()
+    try:
+        yield
+    finally:
+        await stop_system_metrics()
+        mark_worker_dead()
+
 # Create FastAPI application
 app = FastAPI(
     title="Blob Service",
     description="Secure blob storage and processing service",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware with security config
@@ -93,6 +113,19 @@ async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
+# Prometheus metrics endpoint, aggregated across workers in multiprocess mode
+@app.get("/metrics")
+def metrics():
+    """Expose Prometheus metrics.
+    
+    Defined as a plain function so reading the per-worker metric files
+    in multiprocess mode runs in the threadpool.
+    """
+    return Response(
+        content=generate_latest(get_metrics_registry()),
+        media_type=CONTENT_TYPE_LATEST
+    )
+
 # Import and include routers
 from app.routers import auth, blobs, config
 
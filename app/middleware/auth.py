@@ -1,13 +1,59 @@
 from fastapi import Request
 from fastapi.responses import RedirectResponse
-from app.core.response import ResponseFormatter
+from app.core.errors import AuthError
 from app.config import config
+from app.core.security_config import security_config
+from app.utils import jsonutil
 import ipaddress
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 import jwt
 from datetime import datetime, timedelta
 from passlib.hash import pbkdf2_sha256
 import secrets
+import time
+
+# Seconds a verified token payload is reused before verifying again
+TOKEN_CACHE_TTL = 30.0
+
+# Maximum number of verified tokens kept
+TOKEN_CACHE_SIZE = 10_000
+
+# Accepted token algorithms and decode options, shared by every decode
+_JWT_ALGORITHMS = ("HS256",)
+_JWT_OPTIONS = {"require": ["exp"]}
+
+# The auth_token cookie within a Cookie header
+_AUTH_COOKIE_RE = re.compile(r'(?:^|;)\s*auth_token=([^;]*)')
+
+# Returned by _decode_token for a correctly signed but expired token
+_EXPIRED = object()
+
+# Client addresses parsed once per distinct IP string
+_cached_ip_address = lru_cache(maxsize=256)(ipaddress.ip_address)
+
+@lru_cache(maxsize=32)
+def _unauthorized(message: str) -> Tuple[List[Tuple[bytes, bytes]], bytes]:
+    """Build the 401 response headers and body for an auth failure message"""
+    body = jsonutil.dumps(AuthError(message).to_dict())
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    return headers, body
+
+def _parse_networks(
+    entries: List[str],
+) -> Tuple[Union[ipaddress.IPv4Network, ipaddress.IPv6Network], ...]:
+    """Parse whitelisted IPs and CIDRs into networks, skipping invalid entries"""
+    networks = []
+    for entry in entries:
+        try:
+            networks.append(ipaddress.ip_network(entry))
+        except ValueError:
+            continue
+    return tuple(networks)
 
 class AuthMiddleware:
     def __init__(
@@ -22,22 +68,37 @@ class AuthMiddleware:
     ):
         self.app = app
         self.exclude_paths = exclude_paths
-        self._token_blacklist = set()
+        # Excluded path prefixes, matched in one call per request
+        self._exclude_re = re.compile(
+            "|".join(map(re.escape, exclude_paths)) or "(?!)"
+        )
+        auth = config().auth
+        self._require_auth = auth.require_auth
+        self._whitelist_networks = _parse_networks(auth.whitelist_ips)
+        self._domain_suffixes = tuple(
+            domain.lstrip("*.") for domain in auth.whitelist_domains
+        )
+        # Verify with the key tokens are signed with in app.utils.auth
+        self._jwt_key = security_config.auth.jwt_secret_key.encode()
+        # Revoked tokens by expiry; dropped once the token would be rejected anyway
+        self._token_blacklist: Dict[str, float] = {}
+        # Verified payloads by token, as (reuse deadline, payload)
+        self._token_cache: Dict[str, Tuple[float, dict]] = {}
 
     async def __call__(self, scope, receive, send):
         if scope["type"] not in ("http", "websocket"):
             return await self.app(scope, receive, send)
             
-        request = Request(scope, receive=receive, send=send)
-        
-        # Check if path should be excluded from auth
-        path = request.url.path
-        if any(path.startswith(excluded) for excluded in self.exclude_paths):
+        # Check if path should be excluded from auth, straight from the scope
+        path = scope.get("root_path", "") + scope["path"]
+        if self._exclude_re.match(path):
             return await self.app(scope, receive, send)
 
+        request = Request(scope, receive=receive, send=send)
+
         # Get client IP and domain for logging
         client_ip = request.client.host if request.client else None
-        client_domain = request.headers.get("host", "").split(":")[0]
+        client_domain = request.headers.get("host", "").partition(":")[0]
 
         # First check authentication
         auth_result = await self._is_authenticated(request)
@@ -46,13 +107,14 @@ class AuthMiddleware:
             if self._is_in_whitelist(client_ip, client_domain):
                 return await self.app(scope, receive, send)
                 
-            if request.url.path.startswith("/api/"):
+            if path.startswith("/api/"):
                 # Return error for API requests
-                response = ResponseFormatter.error(
-                    message=auth_result.get("message", "Authentication required"),
-                    status_code=401
+                headers, body = _unauthorized(
+                    auth_result.get("message", "Authentication required")
                 )
-                return response(scope, receive, send)
+                await send({"type": "http.response.start", "status": 401, "headers": headers})
+                await send({"type": "http.response.body", "body": body})
+                return
             else:
                 # Redirect to login page for other requests
                 response = RedirectResponse(url="/login")
@@ -65,7 +127,9 @@ class AuthMiddleware:
     async def _is_authenticated(self, request: Request) -> dict:
         """Check if request has valid authentication"""
         try:
-            auth_token = request.cookies.get("auth_token")
+            # Pick the one cookie needed instead of parsing them all
+            match = _AUTH_COOKIE_RE.search(request.headers.get("cookie", ""))
+            auth_token = match.group(1).strip() if match else None
             if not auth_token:
                 return {"authenticated": False, "message": "No auth token provided"}
                 
@@ -73,25 +137,21 @@ class AuthMiddleware:
             if auth_token in self._token_blacklist:
                 return {"authenticated": False, "message": "Token has been revoked"}
                 
-            # Verify JWT token
-            try:
-                payload = jwt.decode(
-                    auth_token,
-                    config.JWT_SECRET_KEY,
-                    algorithms=["HS256"]
-                )
-            except jwt.ExpiredSignatureError:
-                return {"authenticated": False, "message": "Token has expired"}
-            except jwt.InvalidTokenError:
+            # Verify JWT token, reusing a recent verification
+            payload = self._decode_token(auth_token)
+            if payload is None:
                 return {"authenticated": False, "message": "Invalid token"}
+            if payload is _EXPIRED:
+                return {"authenticated": False, "message": "Token has expired"}
             
             # Check if token is expired
-            exp = datetime.fromtimestamp(payload["exp"])
-            if exp < datetime.utcnow():
+            exp = payload["exp"]
+            now = time.time()
+            if exp < now:
                 return {"authenticated": False, "message": "Token has expired"}
                 
             # Check if token needs refresh
-            if self._should_refresh_token(exp):
+            if self._should_refresh_token(exp, now):
                 new_token = self._generate_token(payload["sub"])
                 # Implementation of token refresh response should be handled in the route
                 
@@ -108,37 +168,62 @@ class AuthMiddleware:
         except Exception as e:
             return {"authenticated": False, "message": str(e)}
 
+    def _decode_token(self, token: str) -> Any:
+        """Verify a token, returning its payload, _EXPIRED or None if invalid"""
+        now = time.time()
+        entry = self._token_cache.get(token)
+        if entry is not None:
+            if entry[0] > now:
+                return entry[1]
+            del self._token_cache[token]
+            
+        try:
+            payload = jwt.decode(
+                token,
+                self._jwt_key,
+                algorithms=_JWT_ALGORITHMS,
+                options=_JWT_OPTIONS
+            )
+        except jwt.ExpiredSignatureError:
+            return _EXPIRED
+        except jwt.InvalidTokenError:
+            return None
+            
+        # Drop the oldest entry when full
+        if len(self._token_cache) >= TOKEN_CACHE_SIZE:
+            del self._token_cache[next(iter(self._token_cache))]
+            
+        # Never reuse a payload past the token's own expiry
+        deadline = min(payload.get("exp", now), now + TOKEN_CACHE_TTL)
+        self._token_cache[token] = (deadline, payload)
+        return payload
+
     def _is_in_whitelist(self, client_ip: str, client_domain: str) -> bool:
         """Check if client IP or domain is in whitelist"""
-        if not config.REQUIRE_AUTH:
+        if not self._require_auth:
             return True
             
         # Check IP whitelist
-        if client_ip and config.WHITELIST_IPS:
-            for allowed_ip in config.WHITELIST_IPS:
-                try:
-                    if "/" in allowed_ip:  # CIDR notation
-                        network = ipaddress.ip_network(allowed_ip)
-                        if ipaddress.ip_address(client_ip) in network:
-                            return True
-                    elif client_ip == allowed_ip:  # Exact IP match
-                        return True
-                except ValueError:
-                    continue
+        if client_ip and self._whitelist_networks:
+            try:
+                address = _cached_ip_address(client_ip)
+            except ValueError:
+                address = None
+            if address is not None and any(
+                address in network for network in self._whitelist_networks
+            ):
+                return True
                     
         # Check domain whitelist
-        if client_domain and config.WHITELIST_DOMAINS:
-            return any(
-                client_domain.endswith(domain.lstrip("*."))
-                for domain in config.WHITELIST_DOMAINS
-            )
+        if client_domain and self._domain_suffixes:
+            return client_domain.endswith(self._domain_suffixes)
             
         return False
 
-    def _should_refresh_token(self, exp: datetime) -> bool:
+    def _should_refresh_token(self, exp: float, now: float) -> bool:
         """Check if token should be refreshed"""
         # Refresh token if it's going to expire in the next hour
-        return exp - datetime.utcnow() < timedelta(hours=1)
+        return exp - now < 3600
 
     def _generate_token(self, username: str, roles: List[str] = None, permissions: List[str] = None) -> str:
         """Generate a new JWT token"""
@@ -151,9 +236,24 @@ class AuthMiddleware:
             "roles": roles or [],
             "permissions": permissions or []
         }
-        return jwt.encode(payload, config.JWT_SECRET_KEY, algorithm="HS256")
+        return jwt.encode(payload, self._jwt_key, algorithm="HS256")
 
     def blacklist_token(self, token: str):
         """Add token to blacklist"""
-        self._token_blacklist.add(token)
-        # TODO: Implement token blacklist cleanup mechanism
+        now = time.time()
+        
+        # Decode token without verification to get expiration
+        try:
+            exp = jwt.decode(token, options={"verify_signature": False}).get("exp")
+        except jwt.InvalidTokenError:
+            exp = None
+        if not isinstance(exp, (int, float)):
+            exp = now + 24 * 3600
+        
+        # Drop revoked tokens that have expired since
+        expired = [t for t, t_exp in self._token_blacklist.items() if t_exp < now]
+        for t in expired:
+            del self._token_blacklist[t]
+            
+        self._token_blacklist[token] = exp
+        self._token_cache.pop(token, None)
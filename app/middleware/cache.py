@@ -1,14 +1,35 @@
 """
 Cache middleware implementation.
 """
+import asyncio
 import hashlib
-import json
+import heapq
 import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional, Tuple
 import aiofiles
 import os
 
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
 from .base import BaseMiddleware
+from ..utils import jsonutil
+
+# Writes, or bytes written, between cache size cleanups
+CLEANUP_EVERY_WRITES = 64
+CLEANUP_EVERY_BYTES = 64 * 1024 * 1024  # 64MB
+
+# Payloads at least this large are hashed in a worker thread
+HASH_IN_THREAD_SIZE = 1024 * 1024  # 1MB
+
+def _digest(data: bytes) -> str:
+    """Hash data for a cache key, using BLAKE3 when available."""
+    if blake3 is not None:
+        return blake3(data).hexdigest()
+    return hashlib.sha256(data).hexdigest()
 
 class CacheMiddleware(BaseMiddleware):
     """Middleware for caching file processing results."""
@@ -20,16 +41,31 @@ class CacheMiddleware(BaseMiddleware):
         self.max_age = self.config.get('max_age', 3600)  # 1 hour
         self.max_size = self.config.get('max_size', 1024 * 1024 * 1024)  # 1GB
         self.enabled = self.config.get('enabled', True)
+        self.buffer_size = self.config.get('buffer_size', 64 * 1024 * 1024)  # 64MB
+        
+        # Recently used entries kept in memory, as key -> (expires at, data, metadata)
+        self._mem_cache: "OrderedDict[str, Tuple[float, bytes, Dict[str, Any]]]" = OrderedDict()
+        self._mem_size = 0
         
         # Create cache directory if it doesn't exist
         os.makedirs(self.cache_dir, exist_ok=True)
         
+        # Cached files by key, as (size, last access); scanned once here
+        self._index: Dict[str, Tuple[int, float]] = {}
+        self._total_size = 0
+        self._scan_cache()
+        
+        # Cleanup runs in the background once enough has been written
+        self._writes_since_cleanup = 0
+        self._bytes_since_cleanup = 0
+        self._cleanup_task: Optional[asyncio.Task] = None
+        
         # Initialize cache stats
         self.stats = {
             'hits': 0,
             'misses': 0,
             'errors': 0,
-            'size': 0
+            'size': self._total_size
         }
     
     async def process_upload(self, file_data: bytes, metadata: Dict[str, Any]) -> Tuple[bytes, Dict[str, Any]]:
@@ -39,7 +75,7 @@ class CacheMiddleware(BaseMiddleware):
         
         try:
             # Generate cache key
-            cache_key = self._generate_cache_key(file_data, metadata)
+            cache_key = await self._cache_key(file_data, metadata)
             
             # Try to get from cache
             cached_data = await self._get_from_cache(cache_key)
@@ -66,7 +102,7 @@ class CacheMiddleware(BaseMiddleware):
         
         try:
             # Generate cache key
-            cache_key = self._generate_cache_key(file_data, metadata)
+            cache_key = await self._cache_key(file_data, metadata)
             
             # Try to get from cache
             cached_data = await self._get_from_cache(cache_key)
@@ -86,47 +122,73 @@ class CacheMiddleware(BaseMiddleware):
             print(f"Cache error during download: {e}")
             return file_data, metadata
     
+    async def _cache_key(self, file_data: bytes, metadata: Dict[str, Any]) -> str:
+        """Generate a cache key without blocking the event loop on large files."""
+        if len(file_data) < HASH_IN_THREAD_SIZE:
+            return self._generate_cache_key(file_data, metadata)
+        # The hash functions release the GIL while hashing large buffers
+        return await asyncio.to_thread(self._generate_cache_key, file_data, metadata)
+    
     def _generate_cache_key(self, file_data: bytes, metadata: Dict[str, Any]) -> str:
         """Generate a unique cache key based on file data and metadata."""
         # Create a hash of the file data
-        file_hash = hashlib.sha256(file_data).hexdigest()
+        file_hash = _digest(file_data)
         
         # Create a hash of relevant metadata
-        meta_dict = {
-            'content_type': metadata.get('content_type', ''),
-            'extension': metadata.get('extension', ''),
-            'size': len(file_data)
-        }
-        meta_hash = hashlib.sha256(
-            json.dumps(meta_dict, sort_keys=True).encode()
-        ).hexdigest()
+        meta_key = (
+            f"{metadata.get('content_type', '')}|"
+            f"{metadata.get('extension', '')}|{len(file_data)}"
+        )
+        meta_hash = _digest(meta_key.encode())
         
         return f"{file_hash}_{meta_hash}"
     
     async def _get_from_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
         """Get file data and metadata from cache."""
+        # Serve hot entries without touching the disk
+        entry = self._mem_cache.get(cache_key)
+        if entry is not None:
+            if entry[0] > time.time():
+                self._mem_cache.move_to_end(cache_key)
+                return {
+                    'file_data': entry[1],
+                    'metadata': dict(entry[2])
+                }
+            self._forget(cache_key)
+        
         try:
             cache_path = os.path.join(self.cache_dir, cache_key)
             meta_path = cache_path + '.meta'
             
-            # Check if cache files exist
-            if not (os.path.exists(cache_path) and os.path.exists(meta_path)):
+            # Check if cache is present and not expired with a single stat
+            try:
+                mtime = os.stat(cache_path).st_mtime
+            except FileNotFoundError:
                 return None
-            
-            # Check if cache is expired
-            if time.time() - os.path.getmtime(cache_path) > self.max_age:
+            if time.time() - mtime > self.max_age:
                 # Remove expired cache
-                os.remove(cache_path)
-                os.remove(meta_path)
+                self._unindex(cache_key)
+                for path in (cache_path, meta_path):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                return None
+            
+            # Read metadata first, an entry without it is incomplete; it is
+            # small enough that a thread hop costs more than the read
+            try:
+                with open(meta_path, 'rb') as f:
+                    metadata = jsonutil.loads(f.read())
+            except FileNotFoundError:
                 return None
             
             # Read file data
             async with aiofiles.open(cache_path, 'rb') as f:
                 file_data = await f.read()
             
-            # Read metadata
-            async with aiofiles.open(meta_path, 'r') as f:
-                metadata = json.loads(await f.read())
+            self._touch(cache_key)
+            self._remember(cache_key, mtime + self.max_age, file_data, metadata)
             
             return {
                 'file_data': file_data,
@@ -140,9 +202,6 @@ class CacheMiddleware(BaseMiddleware):
     async def _store_in_cache(self, cache_key: str, file_data: bytes, metadata: Dict[str, Any]):
         """Store file data and metadata in cache."""
         try:
-            # Check cache size
-            await self._cleanup_cache()
-            
             cache_path = os.path.join(self.cache_dir, cache_key)
             meta_path = cache_path + '.meta'
             
@@ -151,49 +210,106 @@ class CacheMiddleware(BaseMiddleware):
                 await f.write(file_data)
             
             # Write metadata
-            async with aiofiles.open(meta_path, 'w') as f:
-                await f.write(json.dumps(metadata))
+            async with aiofiles.open(meta_path, 'wb') as f:
+                await f.write(jsonutil.dumps(metadata))
             
             # Update cache size
-            self.stats['size'] += len(file_data) + os.path.getsize(meta_path)
+            self._unindex(cache_key)
+            self._index[cache_key] = (len(file_data), time.time())
+            self._total_size += len(file_data)
+            self.stats['size'] = self._total_size
+            
+            self._remember(cache_key, time.time() + self.max_age, file_data, metadata)
+            
+            # Check cache size
+            self._schedule_cleanup(len(file_data))
             
         except Exception as e:
             print(f"Cache write error: {e}")
     
+    def _remember(self, cache_key: str, expires_at: float, file_data: bytes, metadata: Dict[str, Any]):
+        """Keep an entry in the memory cache, evicting least recently used ones."""
+        size = len(file_data)
+        if size > self.buffer_size:
+            return
+        
+        self._forget(cache_key)
+        self._mem_cache[cache_key] = (expires_at, file_data, dict(metadata))
+        self._mem_size += size
+        while self._mem_size > self.buffer_size:
+            _, (_, evicted, _) = self._mem_cache.popitem(last=False)
+            self._mem_size -= len(evicted)
+    
+    def _forget(self, cache_key: str):
+        """Drop an entry from the memory cache."""
+        entry = self._mem_cache.pop(cache_key, None)
+        if entry is not None:
+            self._mem_size -= len(entry[1])
+    
+    def _scan_cache(self):
+        """Build the cache index from the files in the cache directory."""
+        self._index.clear()
+        self._total_size = 0
+        # One stat per file, taken from the directory entry
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.meta') or not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                self._index[entry.name] = (st.st_size, st.st_atime)
+                self._total_size += st.st_size
+    
+    def _touch(self, cache_key: str):
+        """Record an access to a cached file."""
+        entry = self._index.get(cache_key)
+        if entry is not None:
+            self._index[cache_key] = (entry[0], time.time())
+    
+    def _unindex(self, cache_key: str):
+        """Remove a cached file from the index."""
+        entry = self._index.pop(cache_key, None)
+        if entry is not None:
+            self._total_size -= entry[0]
+    
+    def _schedule_cleanup(self, size: int):
+        """Start a cache cleanup once enough writes have accumulated."""
+        self._writes_since_cleanup += 1
+        self._bytes_since_cleanup += size
+        if (self._writes_since_cleanup < CLEANUP_EVERY_WRITES
+                and self._bytes_since_cleanup < CLEANUP_EVERY_BYTES):
+            return
+        if self._cleanup_task is not None and not self._cleanup_task.done():
+            return
+        
+        self._writes_since_cleanup = 0
+        self._bytes_since_cleanup = 0
+        self._cleanup_task = asyncio.create_task(self._cleanup_cache())
+    
     async def _cleanup_cache(self):
         """Clean up old cache entries if cache size exceeds limit."""
         try:
-            # Get list of cache files
-            cache_files = []
-            for filename in os.listdir(self.cache_dir):
-                if not filename.endswith('.meta'):
-                    path = os.path.join(self.cache_dir, filename)
-                    cache_files.append({
-                        'path': path,
-                        'size': os.path.getsize(path),
-                        'atime': os.path.getatime(path)
-                    })
-            
-            # Sort by access time (oldest first)
-            cache_files.sort(key=lambda x: x['atime'])
+            if self._total_size <= self.max_size:
+                return
+            
+            # Least recently accessed first
+            heap = [(atime, key) for key, (_, atime) in self._index.items()]
+            heapq.heapify(heap)
             
             # Remove old files until we're under the limit
-            current_size = sum(f['size'] for f in cache_files)
-            for file in cache_files:
-                if current_size <= self.max_size:
-                    break
-                    
+            while heap and self._total_size > self.max_size:
+                _, key = heapq.heappop(heap)
+                self._unindex(key)
+                path = os.path.join(self.cache_dir, key)
                 try:
                     # Remove data file
-                    os.remove(file['path'])
+                    os.remove(path)
                     # Remove metadata file
-                    os.remove(file['path'] + '.meta')
-                    current_size -= file['size']
+                    os.remove(path + '.meta')
                 except Exception as e:
                     print(f"Error removing cache file: {e}")
             
             # Update cache size
-            self.stats['size'] = current_size
+            self.stats['size'] = self._total_size
             
         except Exception as e:
             print(f"Cache cleanup error: {e}")
@@ -10,6 +10,9 @@ from pydantic import BaseModel
 
 router = APIRouter()
 
+# Request sections that map onto AppConfig sections; others are ignored
+_APP_CONFIG_SECTIONS = {"auth", "storage", "features"}
+
 class ConfigUpdateRequest(BaseModel):
     """Configuration update request model."""
     auth: Optional[Dict[str, Any]] = None
@@ -62,44 +65,14 @@ async def update_config(
         Updated configuration
     """
     try:
-        # Get current config
-        current_config = config_manager.get_config()
+        # Make sure the config is loaded
+        config_manager.get_config()
         
-        # Update auth config if provided
-        if config_update.auth:
-            current_config.auth = current_config.auth.copy(
-                update=config_update.auth
-            )
-            
-        # Update storage config if provided 
-        if config_update.storage:
-            current_config.storage = current_config.storage.copy(
-                update=config_update.storage
-            )
-            
-        # Update features config if provided
-        if config_update.features:
-            current_config.features = current_config.features.copy(
-                update=config_update.features
-            )
-            
-        # Update limits config if provided
-        if config_update.limits:
-            current_config.limits = current_config.limits.copy(
-                update=config_update.limits
-            )
-            
-        # Update server config if provided
-        if config_update.server:
-            current_config.server = current_config.server.copy(
-                update=config_update.server
-            )
-            
-        # Update processing config if provided
-        if config_update.processing:
-            current_config.processing = current_config.processing.copy(
-                update=config_update.processing
-            )
+        # Merge the provided sections; update() replaces the config
+        # rather than mutating it, which keeps cached views consistent
+        current_config = config_manager.update(
+            config_update.model_dump(include=_APP_CONFIG_SECTIONS, exclude_none=True)
+        )
             
         # Save updated config
         config_manager.save_config(current_config)
@@ -177,7 +177,7 @@ class BaseStorage(ABC):
             FileMetadata object
         """
         now = datetime.utcnow()
-        return FileMetadata(
+        return FileMetadata.model_construct(
             content_type=content_type,
             size=file.tell(),
             created_at=now,
@@ -131,7 +131,7 @@ class LocalStorageBackend(StorageBackend):
                 
             # Get metadata
             stat = full_path.stat()
-            metadata = FileMetadata(
+            metadata = FileMetadata.model_construct(
                 content_type=mimetypes.guess_type(str(full_path))[0] or "application/octet-stream",
                 size=stat.st_size,
                 created_at=datetime.fromtimestamp(stat.st_ctime),
@@ -166,7 +166,7 @@ class S3StorageBackend(StorageBackend):
                 return file
                 
             # Get metadata
-            metadata = FileMetadata(
+            metadata = FileMetadata.model_construct(
                 content_type=response.get('ContentType', 'application/octet-stream'),
                 size=response['ContentLength'],
                 created_at=response['LastModified'],
@@ -263,7 +263,7 @@ class S3StorageBackend(StorageBackend):
             async for page in paginator.paginate(**kwargs):
                 for obj in page.get('Contents', []):
                     if include_metadata:
-                        metadata = FileMetadata(
+                        metadata = FileMetadata.model_construct(
                             content_type=mimetypes.guess_type(obj['Key'])[0] or 'application/octet-stream',
                             size=obj['Size'],
                             created_at=obj['LastModified'],
@@ -102,7 +102,7 @@ def validate_cache_config(config: Dict[str, Any]):
         
         # Validate cache types
         cache_types = config.get('cache_types', [])
-        if not isinstance(cache_types, list):
+        if not isinstance(cache_types, (list, tuple)):
             raise CacheConfigError("cache_types must be a list")
         
         for mime_type in cache_types:
@@ -0,0 +1,8 @@
+"""
+Python version compatibility helpers.
+"""
+import sys
+from typing import Any, Dict
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,36 @@
+"""
+JSON encoding helpers, using orjson when available.
+"""
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dumps(
+    value: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """Encode JSON to UTF-8 bytes, using orjson when available.
+
+    Args:
+        value: Value to encode
+        indent: Indent nested values with two spaces
+        default: Called to convert objects JSON cannot encode natively
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else None
+        return orjson.dumps(value, default=default, option=option)
+    return json.dumps(value, indent=2 if indent else None, default=default).encode("utf-8")
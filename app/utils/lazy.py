@@ -0,0 +1,61 @@
+"""
+Lazily created module-level singletons.
+"""
+import threading
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+T = TypeVar('T')
+
+class LazySingleton(Generic[T]):
+    """Create an instance on first use and return it afterwards.
+    
+    Creation is guarded by a lock, so concurrent first calls from
+    several threads still create a single instance.
+    """
+    
+    def __init__(self, factory: Callable[[], T]):
+        """Initialize singleton.
+        
+        Args:
+            factory: Callable creating the instance
+        """
+        self._factory = factory
+        self._instance: Optional[T] = None
+        self._lock = threading.Lock()
+        
+    def __call__(self) -> T:
+        """Get the instance, creating it on first use.
+        
+        Returns:
+            Singleton instance
+        """
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+        
+    def peek(self) -> Optional[T]:
+        """Get the instance without creating it.
+        
+        Returns:
+            Singleton instance, or None if it was not created yet
+        """
+        return self._instance
+
+def lazy_module_getattr(module: str, attrs: Dict[str, Callable[[], Any]]) -> Callable[[str], Any]:
+    """Build a module ``__getattr__`` resolving attributes on first access.
+    
+    Args:
+        module: Module name, for error messages
+        attrs: Attribute names mapped to the getter resolving each one
+        
+    Returns:
+        Module-level ``__getattr__`` function
+    """
+    def __getattr__(name: str) -> Any:
+        getter = attrs.get(name)
+        if getter is None:
+            raise AttributeError(f"module {module!r} has no attribute {name!r}")
+        return getter()
+    return __getattr__
@@ -0,0 +1,28 @@
+"""
+Tests for API utility functions.
+"""
+import io
+import tempfile
+
+import pytest
+
+utils = pytest.importorskip("app.api.utils")
+
+def test_spooled_file_in_memory_is_not_disk_backed():
+    with tempfile.SpooledTemporaryFile(max_size=1024) as f:
+        f.write(b"x" * 16)
+        assert not utils._is_disk_backed(f)
+        # The check must not force the file to roll over
+        assert not f._rolled
+
+def test_spooled_file_rolled_to_disk_is_disk_backed():
+    with tempfile.SpooledTemporaryFile(max_size=1024) as f:
+        f.write(b"x" * 2048)
+        assert utils._is_disk_backed(f)
+
+def test_regular_file_is_disk_backed():
+    with tempfile.TemporaryFile() as f:
+        assert utils._is_disk_backed(f)
+
+def test_bytes_buffer_is_not_disk_backed():
+    assert not utils._is_disk_backed(io.BytesIO(b"data"))